@@ -11,12 +11,14 @@ This enhanced version includes:
 """
 
 import argparse
+import bisect
 import json
+import multiprocessing
 import os
 import re
 import sys
+from collections import OrderedDict
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
 from dataclasses import dataclass, field
 from datetime import datetime
 import time
@@ -26,20 +28,107 @@ from typing import Optional, Dict, List, Tuple, Any
 import tempfile
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, repeat
 
 import fitz  # PyMuPDF
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageDraw
 
-# Optional OCR support
+# GUI-only modules, loaded by _gui_imports() so CLI runs don't pay for them
+ttk = filedialog = messagebox = scrolledtext = ImageTk = None
+
+
+def _gui_imports():
+    """Import the Tk widget/dialog modules and ImageTk used only by the GUI"""
+    global ttk, filedialog, messagebox, scrolledtext, ImageTk
+    from tkinter import ttk, filedialog, messagebox, scrolledtext
+    from PIL import ImageTk
+
+# Optional numpy - vectorized geometry checks (also required by the OCR path)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional OCR support - prefer tesserocr's persistent API over pytesseract,
+# which spawns a tesseract process (and reloads language data) per call
 try:
-    import pytesseract
     import cv2
     import numpy as np
 
+    try:
+        import tesserocr
+        pytesseract = None
+    except ImportError:
+        tesserocr = None
+        import pytesseract
+
     OCR_AVAILABLE = True
 except ImportError:
     OCR_AVAILABLE = False
-    print("OCR support not available. Install pytesseract and opencv-python for OCR features.")
+
+# Printed where OCR is offered or asked for, not at import: spawned scan
+# workers re-import this module and would each repeat it
+OCR_MISSING_MSG = ("OCR support not available. Install tesserocr (or pytesseract) "
+                   "and opencv-python for OCR features.")
+
+# Optional fast JSON support - orjson parses/serializes in C, stdlib is the fallback
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, compact: bool = False) -> bytes:
+        return orjson.dumps(obj) if compact else orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj, compact: bool = False) -> bytes:
+        if compact:
+            return json.dumps(obj, separators=(',', ':')).encode()
+        return json.dumps(obj, indent=2).encode()
+
+    def _json_line(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode() + b'\n'
+
+# Optional Aho-Corasick - one pass per page over large pattern/exclusion lists
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional R-tree - spatial index for protected-region and region hit-test lookups
+try:
+    from rtree import index as rtree_index
+except ImportError:
+    rtree_index = None
+
+
+def _read_json(path: Path):
+    """Parse a JSON file straight from its bytes (no decoded str copy)"""
+    return _json_loads(path.read_bytes())
+
+
+def _read_json_fd(path: str):
+    """Parse a small JSON file with one open/fstat/read; no buffered text layer"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # One read normally returns the whole file; finish it off after a short read
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return _json_loads(data)
 
 
 # Tool modes enumeration
@@ -108,51 +197,111 @@ REDACTION_PRESETS = {
 }
 
 
+# Separator between passages in the passage text boxes (a line of 3+ dashes)
+_PASSAGE_SPLIT = re.compile(r'\n-{3,}\n')
+
+
 # ---------------------------------------------------------------------------
 # OCR Helper Functions
 # ---------------------------------------------------------------------------
 class OCRProcessor:
     """Handle OCR processing for scanned PDFs."""
 
+    OCR_CACHE_SIZE: int = 32
+
     def __init__(self):
         self.ocr_available = OCR_AVAILABLE
+        self._api = None  # tesserocr.PyTessBaseAPI, created on first use
+        # One engine serves both the preview (Tk thread) and Save Redacted
+        # (worker thread), so recognition is serialized
+        self._lock = threading.Lock()
+        # (pdf_path, page_num) -> [(text, rect)], most recently used last
+        self.ocr_page_cache: OrderedDict = OrderedDict()
+
+    def _get_api(self):
+        """Return the persistent Tesseract API, creating it lazily."""
+        if self._api is None:
+            self._api = tesserocr.PyTessBaseAPI()
+        return self._api
+
+    def close(self):
+        """Release the persistent Tesseract API if one was created."""
+        # Not while a recognition on another thread is still using it
+        with self._lock:
+            if self._api is not None:
+                self._api.End()
+                self._api = None
 
     def preprocess_image(self, img: Image.Image) -> Image.Image:
         """Preprocess image for better OCR results."""
         if not self.ocr_available:
             return img
+        return Image.fromarray(self.preprocess_array(np.asarray(img)))
 
-        # Convert PIL to OpenCV format
-        open_cv_image = np.array(img)
-
+    def preprocess_array(self, arr: "np.ndarray") -> "np.ndarray":
+        """Grayscale, threshold and denoise an RGB(A) array for OCR."""
         # Convert to grayscale
-        gray = cv2.cvtColor(open_cv_image, cv2.COLOR_RGB2GRAY)
+        code = cv2.COLOR_RGBA2GRAY if arr.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+        gray = cv2.cvtColor(arr, code)
 
         # Apply thresholding to get better OCR results
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
         # Denoise
-        denoised = cv2.fastNlMeansDenoising(thresh)
-
-        # Convert back to PIL
-        return Image.fromarray(denoised)
+        return cv2.fastNlMeansDenoising(thresh)
 
     def extract_text_with_positions(self, page: fitz.Page) -> List[Tuple[str, fitz.Rect]]:
-        """Extract text with positions using OCR."""
+        """Extract text with positions using OCR, reusing earlier results for the same page."""
         if not self.ocr_available:
             return []
 
-        # Get page as image
+        key = (page.parent.name, page.number) if page.parent.name else None
+        with self._lock:
+            if key is not None and key in self.ocr_page_cache:
+                self.ocr_page_cache.move_to_end(key)
+                return self.ocr_page_cache[key]
+            results = self._ocr_page(page)
+            if key is not None:
+                self.ocr_page_cache[key] = results
+                if len(self.ocr_page_cache) > self.OCR_CACHE_SIZE:
+                    self.ocr_page_cache.popitem(last=False)
+        return results
+
+    def _ocr_page(self, page: fitz.Page) -> List[Tuple[str, fitz.Rect]]:
+        """Run OCR on one page (uncached)."""
+        # Get page as image; the pixmap samples are viewed in place as a
+        # numpy array rather than copied into a PIL image first
         pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better OCR
-        img = Image.frombytes('RGB', [pix.width, pix.height], pix.samples)
+        arr = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
 
         # Preprocess
-        img = self.preprocess_image(img)
+        img = self.preprocess_array(arr)
+        del arr, pix
+
+        results = []
+
+        if tesserocr is not None:
+            # Reuse the already-initialised engine; no per-page startup cost
+            api = self._get_api()
+            height, width = img.shape
+            api.SetImageBytes(img.tobytes(), width, height, 1, width)
+            api.Recognize()
+            level = tesserocr.RIL.WORD
+            ri = api.GetIterator()
+            if ri is None:
+                return results
+            for word_it in tesserocr.iterate_level(ri, level):
+                word = word_it.GetUTF8Text(level)
+                box = word_it.BoundingBox(level)
+                if word and word.strip() and box:
+                    # Scale coordinates back to original
+                    x1, y1, x2, y2 = (v / 2 for v in box)
+                    results.append((word, fitz.Rect(x1, y1, x2, y2)))
+            return results
 
         # Get OCR data with positions
         data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
 
-        results = []
         n_boxes = len(data['text'])
 
         for i in range(n_boxes):
@@ -188,6 +337,17 @@ class OCRProcessor:
         return False
 
 
+_OCR_SINGLETON: Optional[OCRProcessor] = None
+
+
+def get_ocr_processor() -> OCRProcessor:
+    """Return the process-wide OCRProcessor so the engine and page cache are shared."""
+    global _OCR_SINGLETON
+    if _OCR_SINGLETON is None:
+        _OCR_SINGLETON = OCRProcessor()
+    return _OCR_SINGLETON
+
+
 # ---------------------------------------------------------------------------
 # File conversion and metadata helpers
 # ---------------------------------------------------------------------------
@@ -243,6 +403,18 @@ def apply_image_redactions(input_img: str, output_img: str,
         scrub_metadata(output_img)
 
 
+# Discriminator written into full config exports
+CONFIG_TYPE = 'redactx.config.v1'
+CONFIG_VERSION = 1
+
+
+# Background pool for config file reads and writes so they don't block the Tk loop
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+# Prefs are rewritten whole on every change; one worker applies the writes in
+# the order they were made, so an older snapshot can never replace a newer one
+_PREFS_POOL = ThreadPoolExecutor(max_workers=1)
+
+
 # ---------------------------------------------------------------------------
 # JSONStore helper (enhanced with preset support)
 # ---------------------------------------------------------------------------
@@ -259,12 +431,15 @@ class JSONStore:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     @staticmethod
-    def write_atomic(path: Path, obj):
-        tmp = path.with_suffix(path.suffix + ".tmp")
-        with open(tmp, 'w') as f:
-            json.dump(obj, f, indent=2)
+    def write_atomic(path: Path, obj, compact: bool = False):
+        # Serialize up front so the file is written with a single write() call;
+        # compact skips indentation for machine-only files (autosaves, prefs)
+        data = _json_dumps(obj, compact)
+        # Per-thread temp name: writes of the same file may run on the IO pool
+        tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}-{threading.get_ident()}.tmp")
+        with open(tmp, 'wb') as f:
+            f.write(data)
         os.replace(tmp, path)
-
     @staticmethod
     def get_timestamped_filename(stem: str, purpose: str) -> Path:
         ts = datetime.now().strftime(JSONStore.TIMESTAMP_FMT)
@@ -275,31 +450,43 @@ class JSONStore:
         autosave = JSONStore.DATA_DIR / f"{stem}_{purpose}_autosave.json"
         if autosave.exists():
             return autosave
-        files = list(JSONStore.DATA_DIR.glob(f"{stem}_{purpose}_*.json"))
-        if not files:
+        # One scandir pass; the timestamp normally comes from the name, and the
+        # DirEntry's stat is only needed for names without one
+        prefix = f"{stem}_{purpose}_"
+        latest = latest_ts = None
+        try:
+            with os.scandir(JSONStore.DATA_DIR) as it:
+                for entry in it:
+                    name = entry.name
+                    if not (name.startswith(prefix) and name.endswith('.json')):
+                        continue
+                    ts = None
+                    m = JSONStore._TS_RE.search(name[:-5])
+                    if m:
+                        try:
+                            ts = datetime.strptime(m.group(1), JSONStore.TIMESTAMP_FMT)
+                        except ValueError:
+                            pass
+                    if ts is None:
+                        ts = datetime.fromtimestamp(entry.stat().st_mtime)
+                    if latest_ts is None or ts > latest_ts:
+                        latest, latest_ts = entry.path, ts
+        except OSError:
             return None
-
-        def _ts(p: Path):
-            m = JSONStore._TS_RE.search(p.stem)
-            if m:
-                try:
-                    return datetime.strptime(m.group(1), JSONStore.TIMESTAMP_FMT)
-                except ValueError:
-                    pass
-            return datetime.fromtimestamp(p.stat().st_mtime)
-
-        return max(files, key=_ts)
+        return Path(latest) if latest else None
 
     @staticmethod
     def find_all_json_files() -> list[Path]:
         """Find all JSON files in the current directory and data directory."""
         json_files = []
-        # Check script directory
-        script_dir = Path(__file__).parent
-        json_files.extend(script_dir.glob("*.json"))
-        # Check data directory
-        if JSONStore.DATA_DIR.exists():
-            json_files.extend(JSONStore.DATA_DIR.glob("*.json"))
+        # Check script directory, then the data directory
+        for folder in (Path(__file__).parent, JSONStore.DATA_DIR):
+            try:
+                with os.scandir(folder) as it:
+                    json_files.extend(Path(e.path) for e in it
+                                      if e.name.endswith('.json') and e.is_file())
+            except OSError:
+                pass
         return json_files
 
     @staticmethod
@@ -307,7 +494,7 @@ class JSONStore:
         """Load saved presets or return defaults."""
         if JSONStore.PRESETS_FILE.exists():
             try:
-                user_presets = json.loads(JSONStore.PRESETS_FILE.read_text())
+                user_presets = _read_json(JSONStore.PRESETS_FILE)
                 # Merge with defaults
                 all_presets = REDACTION_PRESETS.copy()
                 all_presets.update(user_presets)
@@ -329,6 +516,11 @@ class JSONStore:
 # ---------------------------------------------------------------------------
 # RegionStore - manage per PDF regions with undo/redo and autosave
 # ---------------------------------------------------------------------------
+def _clone(d: dict[str, list]) -> dict[str, list]:
+    """Copy a page -> list of coordinate lists mapping, down to the coordinate lists"""
+    return {k: [list(b) for b in v] for k, v in d.items()}
+
+
 @dataclass
 class RegionStore:
     pdf_stem: str
@@ -339,15 +531,32 @@ class RegionStore:
     history: list = field(default_factory=list)
     future: list = field(default_factory=list)
     last_autosave: float = 0.0
+    # Bumped on every change so views can tell when cached lookups are stale
+    revision: int = 0
+    # Open append handle on the journal, and entries written since the last snapshot
+    _journal: Any = field(default=None, repr=False)
+    _journal_ops: int = 0
+    # Set by undo/redo, which only a full snapshot can record; flush_autosave
+    # writes it, and edits stay out of the journal until it has been written
+    snapshot_pending: bool = False
+    # Identifies the autosave snapshot; the journal's header line names the
+    # snapshot its entries follow, so a stale journal is never replayed
+    generation: Optional[int] = None
 
     MAX_HISTORY: int = 50
+    # Edits are appended to a journal; it is folded into the autosave snapshot
+    # after this many entries or this many seconds
+    JOURNAL_COMPACT_OPS: int = 100
+    JOURNAL_COMPACT_SECS: float = 60.0
 
-    def _snapshot(self):
+    def _snapshot(self, page: int):
+        self.revision += 1
         state = {
-            'regions': json.loads(json.dumps(self.regions)),
-            'protect': json.loads(json.dumps(self.protect)),
-            'polygons': json.loads(json.dumps(self.polygons)),
-            'protect_polygons': json.loads(json.dumps(self.protect_polygons)),
+            'page': page,
+            'regions': _clone(self.regions),
+            'protect': _clone(self.protect),
+            'polygons': _clone(self.polygons),
+            'protect_polygons': _clone(self.protect_polygons),
         }
         self.history.append(state)
         if len(self.history) > self.MAX_HISTORY:
@@ -355,106 +564,174 @@ class RegionStore:
         self.future.clear()
 
     def add(self, page: int, bbox: list[float], kind: str = 'redact'):
-        self._snapshot()
+        self._snapshot(page)
         if kind == 'protect':
             self.protect.setdefault(str(page), []).append(bbox)
         else:
             self.regions.setdefault(str(page), []).append(bbox)
-        self.autosave()
+        self._log({'op': 'add', 'page': page, 'kind': kind, 'coords': bbox})
 
     def add_polygon(self, page: int, points: list[float], kind: str = 'redact'):
-        self._snapshot()
+        self._snapshot(page)
         if kind == 'protect':
             self.protect_polygons.setdefault(str(page), []).append(points)
         else:
             self.polygons.setdefault(str(page), []).append(points)
-        self.autosave()
+        self._log({'op': 'add', 'shape': 'polygon', 'page': page, 'kind': kind, 'coords': points})
 
     def remove(self, page: int, index: int, kind: str = 'redact') -> bool:
         """Remove a region by page and index."""
-        self._snapshot()
+        self._snapshot(page)
         key = str(page)
         items = self.protect if kind == 'protect' else self.regions
         arr = items.get(key, [])
         if 0 <= index < len(arr):
             arr.pop(index)
-            self.autosave(force=True)
+            self._log({'op': 'remove', 'page': page, 'kind': kind, 'index': index})
             return True
         return False
 
     def remove_polygon(self, page: int, index: int, kind: str = 'redact') -> bool:
-        self._snapshot()
+        self._snapshot(page)
         key = str(page)
         items = self.protect_polygons if kind == 'protect' else self.polygons
         arr = items.get(key, [])
         if 0 <= index < len(arr):
             arr.pop(index)
-            self.autosave(force=True)
+            self._log({'op': 'remove', 'shape': 'polygon', 'page': page, 'kind': kind, 'index': index})
             return True
         return False
 
     def update(self, page: int, index: int, bbox: list[float], kind: str = 'redact') -> bool:
         """Update an existing region's coordinates."""
-        self._snapshot()
+        self._snapshot(page)
         key = str(page)
         items = self.protect if kind == 'protect' else self.regions
         arr = items.get(key, [])
         if 0 <= index < len(arr):
             arr[index] = bbox
-            self.autosave(force=True)
+            self._log({'op': 'update', 'page': page, 'kind': kind, 'index': index, 'coords': bbox})
             return True
         return False
 
     def update_polygon(self, page: int, index: int, points: list[float], kind: str = 'redact') -> bool:
-        self._snapshot()
+        self._snapshot(page)
         key = str(page)
         items = self.protect_polygons if kind == 'protect' else self.polygons
         arr = items.get(key, [])
         if 0 <= index < len(arr):
             arr[index] = points
-            self.autosave(force=True)
+            self._log({'op': 'update', 'shape': 'polygon', 'page': page, 'kind': kind, 'index': index,
+                       'coords': points})
             return True
         return False
 
-    def undo(self):
+    def undo(self) -> Optional[int]:
+        """Revert the last edit; returns the page it touched, or None if nothing to undo"""
         if not self.history:
-            return False
-        self.future.append({'regions': self.regions, 'protect': self.protect,
+            return None
+        state = self.history.pop()
+        self.revision += 1
+        self.future.append({'page': state.get('page'),
+                            'regions': self.regions, 'protect': self.protect,
                             'polygons': self.polygons,
                             'protect_polygons': self.protect_polygons})
-        state = self.history.pop()
         self.regions = state['regions']
         self.protect = state['protect']
         self.polygons = state.get('polygons', {})
         self.protect_polygons = state.get('protect_polygons', {})
-        return True
+        # Journal entries can't express a whole-state swap; leave it for a
+        # snapshot so bursts of undo/redo cost one write
+        self.snapshot_pending = True
+        return state.get('page')
 
-    def redo(self):
+    def redo(self) -> Optional[int]:
+        """Re-apply the last undone edit; returns the page it touched, or None"""
         if not self.future:
-            return False
-        self.history.append({'regions': self.regions, 'protect': self.protect,
-                            'polygons': self.polygons,
-                            'protect_polygons': self.protect_polygons})
+            return None
         state = self.future.pop()
+        self.revision += 1
+        self.history.append({'page': state.get('page'),
+                             'regions': self.regions, 'protect': self.protect,
+                             'polygons': self.polygons,
+                             'protect_polygons': self.protect_polygons})
         self.regions = state['regions']
         self.protect = state['protect']
         self.polygons = state.get('polygons', {})
         self.protect_polygons = state.get('protect_polygons', {})
-        return True
+        self.snapshot_pending = True
+        return state.get('page')
+
+    def _journal_path(self) -> Path:
+        return JSONStore.DATA_DIR / f"{self.pdf_stem}_regions_journal.jsonl"
+
+    def _log(self, op: dict):
+        """Record one edit (already applied) by appending it to the journal.
+
+        The journal holds the edits made since the autosave snapshot was written.
+        When no journal is open yet, or it has grown past JOURNAL_COMPACT_OPS
+        entries or JOURNAL_COMPACT_SECS seconds, a fresh snapshot is written
+        instead, which already contains this edit. While a snapshot is pending
+        the edit is left for that snapshot to record.
+        """
+        if self.snapshot_pending:
+            return
+        if (self._journal is None or self._journal_ops >= self.JOURNAL_COMPACT_OPS
+                or time.time() - self.last_autosave > self.JOURNAL_COMPACT_SECS):
+            self.autosave(force=True)
+            return
+        self._journal.write(_json_line(op))
+        self._journal.flush()
+        self._journal_ops += 1
+
+    def _apply(self, op: dict):
+        """Replay one journal entry onto the current state"""
+        if op.get('shape') == 'polygon':
+            items = self.protect_polygons if op['kind'] == 'protect' else self.polygons
+        else:
+            items = self.protect if op['kind'] == 'protect' else self.regions
+        if op['op'] == 'add':
+            items.setdefault(str(op['page']), []).append(op['coords'])
+            return
+        arr = items.get(str(op['page']), [])
+        if 0 <= op['index'] < len(arr):
+            if op['op'] == 'remove':
+                arr.pop(op['index'])
+            else:
+                arr[op['index']] = op['coords']
 
     def autosave(self, force: bool = False):
-        """Write regions to an autosave file if more than five seconds have
-        passed since the last save or when ``force`` is ``True``."""
+        """Write regions to the autosave snapshot if more than JOURNAL_COMPACT_SECS
+        have passed since the last one or when ``force`` is ``True``, and start an
+        empty journal on top of it."""
         now = time.time()
-        if force or now - self.last_autosave > 5:
+        if force or now - self.last_autosave > self.JOURNAL_COMPACT_SECS:
             path = JSONStore.DATA_DIR / f"{self.pdf_stem}_regions_autosave.json"
+            generation = time.time_ns()
             JSONStore.write_atomic(path, {
+                'generation': generation,
                 'regions': self.regions,
                 'protect': self.protect,
                 'polygons': self.polygons,
                 'protect_polygons': self.protect_polygons
-            })
+            }, compact=True)
+            # Truncate only after the snapshot is safely in place. A crash in
+            # between leaves the old journal, whose header names the previous
+            # snapshot, so load() won't replay edits this one already holds
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self._journal_path(), 'wb')
+            self._journal.write(_json_line({'generation': generation}))
+            self._journal.flush()
+            self.generation = generation
+            self._journal_ops = 0
             self.last_autosave = now
+            self.snapshot_pending = False
+
+    def flush_autosave(self):
+        """Write the snapshot left pending by undo/redo, if any"""
+        if self.snapshot_pending:
+            self.autosave(force=True)
 
     def save(self):
         fname = JSONStore.get_timestamped_filename(self.pdf_stem, 'regions')
@@ -470,18 +747,52 @@ class RegionStore:
         path = JSONStore.find_latest_file(pdf_stem, 'regions')
         obj = cls(pdf_stem)
         if path and path.exists():
-            data = json.loads(path.read_text())
+            data = _read_json(path)
             obj.regions = data.get('regions', {})
             obj.protect = data.get('protect', {})
             obj.polygons = data.get('polygons', {})
             obj.protect_polygons = data.get('protect_polygons', {})
+            if path.name.endswith('_autosave.json'):
+                obj.generation = data.get('generation')
+                obj._replay_journal()
         return obj
 
+    def _replay_journal(self):
+        """Apply edits journaled after the autosave snapshot was written.
+
+        Only a journal whose header names this snapshot's generation is
+        replayed; snapshots without one predate the header, as do their journals.
+        """
+        try:
+            with open(self._journal_path(), 'rb') as f:
+                for i, line in enumerate(f):
+                    try:
+                        op = _json_loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted write
+                        break
+                    if i == 0 and 'op' not in op:
+                        if op.get('generation') != self.generation:
+                            return
+                        continue
+                    if i == 0 and self.generation is not None:
+                        return
+                    self._apply(op)
+        except OSError:
+            pass
+
 
 # ---------------------------------------------------------------------------
 # PDFCanvas - display a fitz.Page with zoom/pan and draw overlays
 # ---------------------------------------------------------------------------
 class PDFCanvas(tk.Canvas):
+    # Byte budgets for the page caches below; a page costs width * height * 3
+    # bytes as a raster and * 4 as a Tk image, so how many fit depends on zoom
+    PIX_CACHE_BYTES: int = 64 << 20
+    # Finished page images (with overlays) kept for instant revisits
+    PHOTO_CACHE_BYTES: int = 32 << 20
+    RENDER_POLL_MS: int = 10
+
     def __init__(self, master):
         super().__init__(master, bg="grey")
         self.hbar = tk.Scrollbar(master, orient='horizontal', command=self.xview)
@@ -495,22 +806,50 @@ class PDFCanvas(tk.Canvas):
 
         self.page = None
         self.img = None
+        self._img_item = None  # canvas item showing self.img
         self.scale = 2.0
-        self.tool_mode = ToolMode.PAN
+        self.set_tool_mode(ToolMode.PAN)
+
+        # Rasterized pages without overlays: (page number, scale) -> (Image, bytes),
+        # least recently used first; only ever for the document in _pix_doc
+        self._pix_cache: OrderedDict = OrderedDict()
+        self._pix_doc = None
+        # Display cache key -> (PhotoImage, bytes), least recently used first
+        self._photo_cache: OrderedDict = OrderedDict()
+        # Render matrix for the last scale; wheel zoom yields arbitrary floats,
+        # so only one is kept rather than one per scale
+        self._matrix_scale = None
+        self._matrix = None
+        # page.search_for results for the same document: (page number, text) -> rects
+        self._search_cache: dict[tuple[int, str], list] = {}
+        # Prescreen for the current pattern list and its per-page results
+        self._prescreen_list: list | None = None
+        self._prescreen: tuple = ()
+        self._page_patterns_cache: dict[int, list] = {}
+        # MuPDF TextPage of the last page whose text was read: (page number, TextPage);
+        # used for text selection and exclusion-context checks
+        self._textpage_entry: tuple | None = None
+        # Overlay compositing runs off the Tk thread; _render_gen identifies the
+        # newest request so results of superseded renders are dropped
+        self._render_executor = ThreadPoolExecutor(max_workers=1)
+        self._render_future = None
+        self._render_gen = 0
 
         # Text selection state
         self.selection_start = None
         self.selection_rect = None
 
         # OCR support
-        self.ocr_processor = OCRProcessor()
+        self.ocr_processor = get_ocr_processor()
         self.ocr_results = []
 
     def display(self, page: fitz.Page, regions: list[list], protect: list[list], scale: float = 2.0,
                 polygons: list[list] | None = None, protect_polygons: list[list] | None = None,
                 patterns: dict | None = None, exclusions: list | None = None,
                 excluded_passages: list | None = None, preview: bool = False,
-                use_ocr: bool = False, regex_patterns: list | None = None):
+                use_ocr: bool = False, regex_patterns: list | None = None, cache_key=None):
+        """Render ``page`` with overlays. ``cache_key``, when given, must identify
+        everything the result depends on; finished images are kept per key."""
         self.scale = scale
         self.page = page
         self.ocr_results = []
@@ -519,26 +858,110 @@ class PDFCanvas(tk.Canvas):
         if use_ocr and self.ocr_processor.ocr_available:
             self.ocr_results = self.ocr_processor.extract_text_with_positions(page)
 
-        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))
-        img = Image.frombytes('RGB', [pix.width, pix.height], pix.samples)
-        draw = ImageDraw.Draw(img, 'RGBA')
+        # Supersede any render still queued or running; only the newest one is shown
+        self._render_gen += 1
+        if self._render_future is not None:
+            self._render_future.cancel()
+            self._render_future = None
+
+        if cache_key is not None and self._pix_doc is page.parent:
+            hit = self._photo_cache.get(cache_key)
+            if hit is not None:
+                self._photo_cache.move_to_end(cache_key)
+                self._show(hit[0])
+                return
+
+        # MuPDF is not thread-safe, so rasterizing and text searches stay on
+        # this thread; only the Pillow compositing goes to the render worker
+        base = self._render_base(page, scale)
+        boxes = self._preview_boxes(page, protect, protect_polygons or [], patterns, exclusions,
+                                    excluded_passages, regex_patterns) if preview else []
 
-        polygons = polygons or []
-        protect_polygons = protect_polygons or []
+        self._render_future = self._render_executor.submit(
+            self._compose, base, scale, regions, protect, polygons or [], protect_polygons or [],
+            preview, boxes)
+        self._poll_render(self._render_future, self._render_gen, cache_key)
 
+    def _poll_render(self, future, gen: int, cache_key=None):
+        """Show the composited page once the render worker finishes it"""
+        if gen != self._render_gen:
+            return
+        if not future.done():
+            self.after(self.RENDER_POLL_MS, self._poll_render, future, gen, cache_key)
+            return
+        self._render_future = None
+        # Release the previous PhotoImage before building the next one so two
+        # full-page Tk images are never alive at once (unless it is cached)
+        self._delete_page_image()
+        self.img = None
+        photo = ImageTk.PhotoImage(future.result())
+        if cache_key is not None:
+            self._cache_put(self._photo_cache, cache_key, photo,
+                            photo.width() * photo.height() * 4, self.PHOTO_CACHE_BYTES)
+        self._show(photo)
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, nbytes: int, budget: int):
+        """Add ``value`` to an LRU of (value, bytes), evicting the oldest entries
+        beyond ``budget`` bytes; a value larger than the whole budget is not kept"""
+        if nbytes > budget:
+            return
+        cache[key] = (value, nbytes)
+        total = sum(n for _, n in cache.values())
+        while total > budget:
+            _, (_, n) = cache.popitem(last=False)
+            total -= n
+
+    def _delete_page_image(self):
+        if self._img_item is not None:
+            self.delete(self._img_item)
+            self._img_item = None
+
+    def _show(self, photo):
+        # Only the page image is replaced; a rubber band, polygon or text
+        # selection in progress stays on the canvas, above the new page
+        self._delete_page_image()
+        self.img = photo
+        self._img_item = self.create_image(0, 0, image=photo, anchor='nw')
+        self.tag_lower(self._img_item)
+        self.config(scrollregion=self.bbox(self._img_item))
+
+    def _compose(self, base: Image.Image, scale: float, regions: list, protect: list,
+                 polygons: list, protect_polygons: list, preview: bool, boxes: list) -> Image.Image:
+        """Overlay regions (and preview boxes) on a copy of ``base``; touches no MuPDF objects"""
+        img = base.copy()
+        self._paint_overlays(img, scale, regions, protect, polygons, protect_polygons, preview, boxes)
+        return img
+
+    def _paint_overlays(self, img: Image.Image, scale: float, regions: list, protect: list,
+                        polygons: list, protect_polygons: list, preview: bool, boxes: list):
+        """Paint region highlights and, in preview mode, black redaction boxes onto ``img``"""
         # Draw regions
-        for x1, y1, x2, y2 in regions:
-            draw.rectangle([x1 * scale, y1 * scale, x2 * scale, y2 * scale], fill=(255, 0, 0, 80), outline='red',
-                           width=2)
-        for pts in polygons:
-            scaled = [p * scale for p in pts]
-            draw.polygon(scaled, fill=(255, 0, 0, 80), outline='red')
-        for x1, y1, x2, y2 in protect:
-            draw.rectangle([x1 * scale, y1 * scale, x2 * scale, y2 * scale], fill=(0, 255, 0, 80), outline='green',
-                           width=2)
-        for pts in protect_polygons:
-            scaled = [p * scale for p in pts]
-            draw.polygon(scaled, fill=(0, 255, 0, 80), outline='green')
+        layers = (((255, 0, 0), 'red', regions, polygons),
+                  ((0, 255, 0), 'green', protect, protect_polygons))
+        if np is not None and (regions or protect):
+            arr = np.asarray(img).copy()
+            self._blend_rects(arr, regions, scale, (255, 0, 0), (255, 0, 0))
+            self._blend_rects(arr, protect, scale, (0, 255, 0), (0, 128, 0))
+            img.paste(Image.fromarray(arr))
+            layers = tuple((fill, outline, [], polys) for fill, outline, _, polys in layers)
+        draw = ImageDraw.Draw(img)
+        for fill, outline, rects, polys in layers:
+            if not rects and not polys:
+                continue
+            # Stamp every translucent shape of this color into one mask and
+            # blend it with a single paste rather than one RGBA draw per shape
+            mask = Image.new('L', img.size, 0)
+            mask_draw = ImageDraw.Draw(mask)
+            for x1, y1, x2, y2 in rects:
+                mask_draw.rectangle([x1 * scale, y1 * scale, x2 * scale, y2 * scale], fill=80)
+            for pts in polys:
+                mask_draw.polygon([p * scale for p in pts], fill=80)
+            img.paste(fill, mask=mask)
+            for x1, y1, x2, y2 in rects:
+                draw.rectangle([x1 * scale, y1 * scale, x2 * scale, y2 * scale], outline=outline, width=2)
+            for pts in polys:
+                draw.polygon([p * scale for p in pts], outline=outline)
 
         if preview:
             # Apply region redactions in preview
@@ -547,76 +970,152 @@ class PDFCanvas(tk.Canvas):
             for pts in polygons:
                 scaled = [p * scale for p in pts]
                 draw.polygon(scaled, fill='black')
+            for x0, y0, x1, y1 in boxes:
+                draw.rectangle([x0 * scale, y0 * scale, x1 * scale, y1 * scale], fill='black')
+
+    def _preview_boxes(self, page: fitz.Page, protect: list, protect_polygons: list,
+                       patterns: dict | None, exclusions: list | None,
+                       excluded_passages: list | None, regex_patterns: list | None) -> list:
+        """Page-space rects that pattern, OCR and regex matches would redact"""
+        boxes = []
+        # Casefold exclusions and index the protected rects once per pass
+        excl_folded = tuple(dict.fromkeys(e.casefold() for e in chain(exclusions or (), excluded_passages or ())))
+        protected = ProtectIndex(protect + [self._polygon_bbox(p) for p in protect_polygons])
+
+        # Apply text pattern redactions in preview
+        if patterns:
+            patt_list = patterns.get('keywords', []) + patterns.get('passages', [])
+            patt_folded = [pat.casefold() for pat in patt_list]
+
+            # Skip patterns that match any exclusion, then search only
+            # those whose text is actually on this page
+            search_list = [pat for pat, pat_f in zip(patt_list, patt_folded)
+                           if not any(e in pat_f for e in excl_folded)]
+            for pat in self._page_patterns(page, search_list):
+                for area in self._search(page, pat):
+                    if self._should_redact_area(area, protected, excl_folded, page):
+                        boxes.append(tuple(area))
+
+            # Search in OCR text if available
+            if self.ocr_results:
+                for text, rect in self.ocr_results:
+                    text_f = text.casefold()
+                    for pat_f in patt_folded:
+                        if pat_f in text_f:
+                            if self._should_redact_area(rect, protected, excl_folded, page):
+                                boxes.append(tuple(rect))
+
+        # Apply regex pattern redactions
+        if regex_patterns:
+            text = page.get_text()
+            for pattern in regex_patterns:
+                try:
+                    for match in re.finditer(pattern, text, re.IGNORECASE):
+                        # Try to find the match location on the page
+                        matched_text = match.group(0)
+                        for area in self._search(page, matched_text):
+                            if self._should_redact_area(area, protected, excl_folded, page):
+                                boxes.append(tuple(area))
+                except re.error:
+                    continue
+        return boxes
 
-            # Apply text pattern redactions in preview
-            if patterns:
-                patt_list = patterns.get('keywords', []) + patterns.get('passages', [])
-                all_exclusions = (exclusions or []) + (excluded_passages or [])
-
-                # Search in regular text
-                for pat in patt_list:
-                    # Skip if pattern matches any exclusion
-                    if any(excl.lower() in pat.lower() for excl in all_exclusions):
-                        continue
-
-                    combined_protect = protect + [self._polygon_bbox(p) for p in protect_polygons]
-                    for area in page.search_for(pat, quads=False):
-                        if self._should_redact_area(area, combined_protect, all_exclusions, page):
-                            draw.rectangle([area.x0 * scale, area.y0 * scale, area.x1 * scale, area.y1 * scale],
-                                           fill='black')
-
-                # Search in OCR text if available
-                if self.ocr_results:
-                    for text, rect in self.ocr_results:
-                        for pat in patt_list:
-                            if pat.lower() in text.lower():
-                                if self._should_redact_area(rect, combined_protect, all_exclusions, page):
-                                    draw.rectangle([rect.x0 * scale, rect.y0 * scale,
-                                                    rect.x1 * scale, rect.y1 * scale], fill='black')
-
-            # Apply regex pattern redactions
-            if regex_patterns:
-                text = page.get_text()
-                for pattern in regex_patterns:
-                    try:
-                        for match in re.finditer(pattern, text, re.IGNORECASE):
-                            # Try to find the match location on the page
-                            matched_text = match.group(0)
-                            for area in page.search_for(matched_text, quads=False):
-                                if self._should_redact_area(area, combined_protect, all_exclusions, page):
-                                    draw.rectangle([area.x0 * scale, area.y0 * scale,
-                                                    area.x1 * scale, area.y1 * scale], fill='black')
-                    except re.error:
-                        continue
-
-        self.img = ImageTk.PhotoImage(img)
-        self.delete('all')
-        self.create_image(0, 0, image=self.img, anchor='nw')
-        self.config(scrollregion=self.bbox('all'))
+    @staticmethod
+    def _blend_rects(arr, rects: list, scale: float, fill: tuple, outline: tuple, alpha: float = 80 / 255):
+        """Blend ``fill`` into each of ``rects`` on the RGB array ``arr`` and draw a 2px outline"""
+        h, w = arr.shape[:2]
+        fill_part = np.array(fill, dtype=np.float32) * alpha
+        for x1, y1, x2, y2 in rects:
+            xa, ya = max(0, round(x1 * scale)), max(0, round(y1 * scale))
+            xb, yb = min(w, round(x2 * scale) + 1), min(h, round(y2 * scale) + 1)
+            if xa >= xb or ya >= yb:
+                continue
+            sub = arr[ya:yb, xa:xb]
+            sub[...] = sub * (1 - alpha) + fill_part + 0.5
+            sub[:2] = outline
+            sub[-2:] = outline
+            sub[:, :2] = outline
+            sub[:, -2:] = outline
+
+    def _render_base(self, page: fitz.Page, scale: float) -> Image.Image:
+        """Rasterize ``page`` at ``scale``, reusing recent results for the same document"""
+        if self._pix_doc is not page.parent:
+            self.clear_page_cache()
+            self._pix_doc = page.parent
+        key = (page.number, scale)
+        hit = self._pix_cache.get(key)
+        if hit is not None:
+            self._pix_cache.move_to_end(key)
+            return hit[0]
+        if self._matrix_scale != scale:
+            self._matrix_scale, self._matrix = scale, fitz.Matrix(scale, scale)
+        pix = page.get_pixmap(matrix=self._matrix)
+        # samples_mv is a view of MuPDF's buffer; samples would copy it to bytes first
+        img = Image.frombuffer('RGB', (pix.width, pix.height), pix.samples_mv, 'raw', 'RGB', pix.stride, 1)
+        self._cache_put(self._pix_cache, key, img, pix.stride * pix.height, self.PIX_CACHE_BYTES)
+        return img
+
+    def clear_page_cache(self):
+        """Drop cached page rasters (call when the document changes)"""
+        self._pix_cache.clear()
+        self._pix_doc = None
+        self._photo_cache.clear()
+        self._search_cache.clear()
+        self._page_patterns_cache.clear()
+        self._textpage_entry = None
+
+    def _textpage(self, page: fitz.Page):
+        """TextPage for ``page``, reused for text selection and exclusion context.
+
+        It is kept until another page is used.
+
+        display_page fetches a fresh Page object each time, so this is keyed by
+        page number and read with extractTextbox, which (unlike get_textbox)
+        doesn't require the exact Page object it was made from.
+        """
+        entry = self._textpage_entry
+        if entry is None or entry[0] != page.number:
+            entry = self._textpage_entry = (page.number, page.get_textpage())
+        return entry[1]
+
+    def _page_patterns(self, page: fitz.Page, search_list: list) -> list:
+        """Patterns from ``search_list`` that occur on ``page``, via a single prescreen pass"""
+        if search_list != self._prescreen_list:
+            self._prescreen_list = search_list
+            self._prescreen = _cached_build(_build_prescreen, search_list)
+            self._page_patterns_cache.clear()
+        found = self._page_patterns_cache.get(page.number)
+        if found is None:
+            found = self._page_patterns_cache[page.number] = _prescreen(page, search_list, *self._prescreen)
+        return found
+
+    def _search(self, page: fitz.Page, text: str) -> list:
+        """Memoized ``page.search_for``; valid while ``page.parent`` is the cached document"""
+        key = (page.number, text)
+        areas = self._search_cache.get(key)
+        if areas is None:
+            areas = self._search_cache[key] = page.search_for(text, quads=False)
+        return areas
 
     def _polygon_bbox(self, pts: list[float]) -> Tuple[float, float, float, float]:
         xs = pts[0::2]
         ys = pts[1::2]
         return min(xs), min(ys), max(xs), max(ys)
 
-    def _should_redact_area(self, area: fitz.Rect, protect: list, exclusions: list, page: fitz.Page) -> bool:
-        """Check if an area should be redacted based on protection and exclusions."""
+    def _should_redact_area(self, area: fitz.Rect, protect: 'ProtectIndex', exclusions, page: fitz.Page) -> bool:
+        """Check if an area should be redacted based on protection and exclusions.
+
+        ``exclusions`` must already be casefolded.
+        """
         # Check if area is protected
-        for px1, py1, px2, py2 in protect:
-            if (area.x0 >= px1 and area.y0 >= py1 and
-                    area.x1 <= px2 and area.y1 <= py2):
-                return False
+        if protect.contains(area):
+            return False
 
-        # Check context for exclusions
-        expanded = fitz.Rect(area)
-        expanded.x0 -= 20
-        expanded.x1 += 20
-        try:
-            context = page.get_textbox(expanded)
-            if any(excl.lower() in context.lower() for excl in exclusions):
+        # Check context for exclusions against the page's cached TextPage
+        if exclusions:
+            context = _context_text(self._textpage(page), area)
+            if any(excl in context for excl in exclusions):
                 return False
-        except:
-            pass
 
         return True
 
@@ -664,7 +1163,7 @@ class PDFCanvas(tk.Canvas):
 
             # Get text in selection
             rect = fitz.Rect(x0, y0, x1, y1)
-            text = self.page.get_textbox(rect)
+            text = self._textpage(self.page).extractTextbox(rect)
 
             # Also check OCR results if available
             if not text.strip() and self.ocr_results:
@@ -685,12 +1184,29 @@ class PDFCanvas(tk.Canvas):
 # PDFRedactorGUI - main application window (enhanced)
 # ---------------------------------------------------------------------------
 class PDFRedactorGUI:
+    PRESET_DETAILS_CACHE_SIZE: int = 64
+    # Trailing-edge preview delays: discrete edits vs. continuous input
+    PREVIEW_DELAY_MS: int = 150
+    PREVIEW_CONTINUOUS_DELAY_MS: int = 250
+    # Canvas drag updates are applied at most once per frame (~60 Hz)
+    DRAG_FRAME_MS: int = 16
+    # Pages with this many regions of one kind get an R-tree for hit-testing
+    REGION_RTREE_MIN_BOXES: int = 64
+    REGION_NUMPY_MIN_BOXES: int = 16
+    ZOOM_DECIMALS: int = 3
+    # Scroll units per X11 wheel button (4/5 vertical, 6/7 tilt)
+    _WHEEL_BUTTON_UNITS = {4: -1, 5: 1, 6: -1, 7: 1}
+    _WHEEL_TILT_BUTTONS = frozenset((6, 7))
+    # Region snapshots left pending by undo/redo are written at most this often
+    AUTOSAVE_FLUSH_MS: int = 1000
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title(JSONStore.APP_STEM)
         self.root.geometry('1200x800')
         self.doc = None
-        self.current_page = 0
+        self._page_count = 0
+        self._set_page(0)
         self.region_store = None
 
         # Current tool mode
@@ -701,6 +1217,13 @@ class PDFRedactorGUI:
         self.exclusions = []
         self.excluded_passages = []  # New: separate list for excluded passages
         self.regex_patterns = []  # For preset regex patterns
+        self._patterns_ui_fp = None  # fingerprint of patterns last pushed to the widgets
+        # Passage text boxes edited since they were last parsed (see _sync_from_ui)
+        self._patterns_dirty = False
+        self._exclusions_dirty = False
+        # Shadow sets for O(1) duplicate checks when adding single entries
+        self._kw_set: set[str] = set()
+        self._excl_set: set[str] = set()
 
         # OCR settings
         self.use_ocr = tk.BooleanVar(value=False)
@@ -710,22 +1233,57 @@ class PDFRedactorGUI:
         # Presets
         self.presets = JSONStore.load_presets()
         self.current_preset = None
+        self.last_selected_text = ''
+        # Kept sorted incrementally as presets are saved/deleted
+        self._sorted_preset_names: list[str] = sorted(self.presets)
+        # Rendered preset details, keyed by (name, id(preset)); LRU ordered
+        self._preset_details_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
 
         # Remember last pane position for resizable layout
         self.last_pane_position: int | None = None
+        # Last-known zoom and document; kept current where they change so
+        # save_prefs can read them directly
+        self.last_zoom: float = 2.0
+        self.last_pdf: str = ''
+
+        # Pending prefs write shared by every trigger (pane, zoom, open)
+        self._prefs_timer = None
+        self._prefs_dirty = False
+        # Pending region snapshot write after undo/redo
+        self._autosave_timer = None
+        # Pending trailing-edge preview refresh
+        self._preview_after_id = None
+        # Render key of what is on the canvas; _dirty forces the next render
+        self._dirty = True
+        self._last_render_key = None
+        # Save Redacted worker while it runs (see save_redacted)
+        self._save_thread = None
+        # Casefolded exclusions handed to apply_redactions, and the lists they came from
+        self._excl_cf: list[str] = []
+        self._excl_cf_src = None
+        # Cached region hit-test index (see _region_hit_index)
+        self._region_index_store = None
+        self._region_index_key = None
+        self._region_index = []
+        # Rows currently in the region tree: iid -> values
+        self._tree_state: dict[str, tuple] = {}
+        # A display_page queued by _schedule_redraw and not yet run
+        self._redraw_pending = False
+        # Pending coalesced canvas drag
+        self._drag_pending = None
+        self._last_drag_event = None
 
         self.load_app_configs()
         self.auto_detect_json_files()  # New: auto-detect JSON files
         self.load_prefs()
 
         self.setup_ui()
-        if hasattr(self, 'last_zoom'):
-            self.canvas.scale = self.last_zoom
+        self.canvas.scale = self.last_zoom
         self.bind_events()
         self.start_config_monitor()
 
         # Apply saved window state
-        if hasattr(self, 'last_pdf') and self.last_pdf and Path(self.last_pdf).exists():
+        if self.last_pdf and Path(self.last_pdf).exists():
             self.open_pdf(self.last_pdf)
 
     def bind_events(self):
@@ -814,7 +1372,7 @@ class PDFRedactorGUI:
                 # Load most recent pattern file
                 latest_pattern = max(pattern_files, key=lambda f: f.stat().st_mtime)
                 try:
-                    self.patterns = json.loads(latest_pattern.read_text())
+                    self.patterns = _read_json(latest_pattern)
                     self.update_patterns_ui()
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to load patterns: {e}")
@@ -823,7 +1381,7 @@ class PDFRedactorGUI:
                 # Load most recent exclusion file
                 latest_exclusion = max(exclusion_files, key=lambda f: f.stat().st_mtime)
                 try:
-                    data = json.loads(latest_exclusion.read_text())
+                    data = _read_json(latest_exclusion)
                     if isinstance(data, list):
                         self.exclusions = data
                     elif isinstance(data, dict):
@@ -835,32 +1393,49 @@ class PDFRedactorGUI:
 
     def start_config_monitor(self):
         """Start polling configuration files for changes"""
-        pat = JSONStore.find_latest_file('app_wide', 'patterns')
-        exc = JSONStore.find_latest_file('app_wide', 'exclusions')
+        self._config_dir_mtime = self._data_dir_mtime()
+        pat = self._pattern_file = JSONStore.find_latest_file('app_wide', 'patterns')
+        exc = self._exclusion_file = JSONStore.find_latest_file('app_wide', 'exclusions')
         self._pattern_mtime = pat.stat().st_mtime if pat and pat.exists() else 0
         self._exclusion_mtime = exc.stat().st_mtime if exc and exc.exists() else 0
         self.root.after(2000, self.check_config_files)
 
+    @staticmethod
+    def _data_dir_mtime() -> float:
+        try:
+            return JSONStore.DATA_DIR.stat().st_mtime
+        except OSError:
+            return 0
+
     def check_config_files(self):
         changed = False
-        pat = JSONStore.find_latest_file('app_wide', 'patterns')
+        # Files are only added or replaced (write_atomic renames) when the data
+        # directory's mtime moves; until then the latest files can't change and
+        # the glob in find_latest_file is skipped
+        dir_mtime = self._data_dir_mtime()
+        if dir_mtime != self._config_dir_mtime:
+            self._config_dir_mtime = dir_mtime
+            self._pattern_file = JSONStore.find_latest_file('app_wide', 'patterns')
+            self._exclusion_file = JSONStore.find_latest_file('app_wide', 'exclusions')
+
+        pat = self._pattern_file
         if pat and pat.exists():
             m = pat.stat().st_mtime
             if m != getattr(self, '_pattern_mtime', None):
                 try:
-                    self.patterns = json.loads(pat.read_text())
+                    self.patterns = _read_json(pat)
                     self.update_patterns_ui()
                     changed = True
                 except Exception:
                     pass
                 self._pattern_mtime = m
 
-        exc = JSONStore.find_latest_file('app_wide', 'exclusions')
+        exc = self._exclusion_file
         if exc and exc.exists():
             m = exc.stat().st_mtime
             if m != getattr(self, '_exclusion_mtime', None):
                 try:
-                    data = json.loads(exc.read_text())
+                    data = _read_json(exc)
                     if isinstance(data, list):
                         self.exclusions = data
                         self.excluded_passages = []
@@ -882,9 +1457,9 @@ class PDFRedactorGUI:
         pat = JSONStore.find_latest_file('app_wide', 'patterns')
         exc = JSONStore.find_latest_file('app_wide', 'exclusions')
         if pat and pat.exists():
-            self.patterns = json.loads(pat.read_text())
+            self.patterns = _read_json(pat)
         if exc and exc.exists():
-            data = json.loads(exc.read_text())
+            data = _read_json(exc)
             if isinstance(data, list):
                 self.exclusions = data
             elif isinstance(data, dict):
@@ -892,6 +1467,7 @@ class PDFRedactorGUI:
                 self.excluded_passages = data.get('passages', [])
 
     def save_app_configs(self):
+        self._sync_from_ui()
         fn1 = JSONStore.get_timestamped_filename('app_wide', 'patterns')
         JSONStore.write_atomic(fn1, self.patterns)
 
@@ -913,35 +1489,49 @@ class PDFRedactorGUI:
         )
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-
-                # Determine what type of config this is
-                if 'keywords' in data or 'passages' in data:
-                    # It's a patterns file
-                    self.patterns = data
-                    self.update_patterns_ui()
-                    messagebox.showinfo("Success", "Patterns imported successfully")
-                elif isinstance(data, list):
-                    # It's a simple exclusions list
-                    self.exclusions = data
-                    self.update_exclusions_ui()
-                    messagebox.showinfo("Success", "Exclusions imported successfully")
-                elif 'exclusions' in data:
-                    # It might be a full config export
-                    if 'patterns' in data:
-                        self.patterns = data['patterns']
-                        self.update_patterns_ui()
-                    if 'exclusions' in data:
-                        self.exclusions = data['exclusions']
-                        self.update_exclusions_ui()
-                    messagebox.showinfo("Success", "Configuration imported successfully")
-                else:
-                    messagebox.showwarning("Warning", "Unrecognized configuration format")
+                data = _read_json(Path(filename))
+                t = data.get('_type') if isinstance(data, dict) else None
+                handler = self._IMPORT_HANDLERS.get(t, PDFRedactorGUI._import_legacy)
+                handler(self, data)
 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to import configuration:\n{e}")
 
+    def _import_full_config(self, data):
+        """Apply a full configuration export (patterns and exclusions)"""
+        if 'patterns' in data:
+            self.patterns = data['patterns']
+            self._patterns_ui_fp = None
+            self.update_patterns_ui()
+        if 'exclusions' in data:
+            self.exclusions = data['exclusions']
+            self.update_exclusions_ui()
+        messagebox.showinfo("Success", "Configuration imported successfully")
+
+    def _import_legacy(self, data):
+        """Infer the format of an untagged config file from its shape"""
+        if 'keywords' in data or 'passages' in data:
+            # It's a patterns file
+            self.patterns = data
+            self._patterns_ui_fp = None
+            self.update_patterns_ui()
+            messagebox.showinfo("Success", "Patterns imported successfully")
+        elif isinstance(data, list):
+            # It's a simple exclusions list
+            self.exclusions = data
+            self.update_exclusions_ui()
+            messagebox.showinfo("Success", "Exclusions imported successfully")
+        elif 'exclusions' in data:
+            # It might be a full config export
+            self._import_full_config(data)
+        else:
+            messagebox.showwarning("Warning", "Unrecognized configuration format")
+
+    # Tagged config formats; files without a known '_type' go through _import_legacy
+    _IMPORT_HANDLERS = {
+        CONFIG_TYPE: _import_full_config,
+    }
+
     def export_config(self):
         """Export current configuration to JSON file"""
         filename = filedialog.asksaveasfilename(
@@ -951,29 +1541,40 @@ class PDFRedactorGUI:
             initialfile=f"redaction_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         )
         if filename:
-            try:
-                config = {
-                    'patterns': self.patterns,
-                    'exclusions': self.exclusions,
-                    'excluded_passages': self.excluded_passages,
-                    'regex_patterns': self.regex_patterns,
-                    'preset': self.current_preset,
-                    'exported': datetime.now().isoformat()
-                }
-                with open(filename, 'w') as f:
-                    json.dump(config, f, indent=2)
-                messagebox.showinfo("Success", f"Configuration exported to:\n{filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export configuration:\n{e}")
+            self._sync_from_ui()
+            # Snapshot the lists; serialization and the write happen on the IO pool
+            config = {
+                'patterns': {k: list(v) if isinstance(v, list) else v for k, v in self.patterns.items()},
+                'exclusions': list(self.exclusions),
+                'excluded_passages': list(self.excluded_passages),
+                'regex_patterns': list(self.regex_patterns),
+                'preset': self.current_preset,
+                'exported': datetime.now().isoformat(),
+                '_type': CONFIG_TYPE,
+                '_ver': CONFIG_VERSION,
+            }
+            fut = _IO_POOL.submit(JSONStore.write_atomic, Path(filename), config)
+            self.root.after(50, lambda: self._poll_export(fut, filename))
+
+    def _poll_export(self, fut, filename):
+        """Report the result of a background export once it has finished"""
+        if not fut.done():
+            self.root.after(50, lambda: self._poll_export(fut, filename))
+            return
+        e = fut.exception()
+        if e is None:
+            messagebox.showinfo("Success", f"Configuration exported to:\n{filename}")
+        else:
+            messagebox.showerror("Error", f"Failed to export configuration:\n{e}")
 
     def load_prefs(self):
         if JSONStore.PREFS_FILE.exists():
             try:
-                data = json.loads(JSONStore.PREFS_FILE.read_text())
+                data = _read_json(JSONStore.PREFS_FILE)
                 geom = data.get('window_geometry')
                 if geom:
                     self.root.geometry(geom)
-                self.last_pdf = data.get('last_pdf')
+                self.last_pdf = data.get('last_pdf') or ''
                 self.last_pane_position = data.get('pane_position')
                 self.last_zoom = data.get('last_zoom', 2.0)
                 self.convert_img_var.set(data.get('convert_images', False))
@@ -984,13 +1585,14 @@ class PDFRedactorGUI:
     def save_prefs(self):
         data = {
             'window_geometry': self.root.geometry(),
-            'last_pdf': getattr(self, 'last_pdf', ''),
+            'last_pdf': self.last_pdf,
             'pane_position': self.last_pane_position,
-            'last_zoom': getattr(self.canvas, 'scale', 2.0),
+            'last_zoom': self.last_zoom,
             'convert_images': self.convert_img_var.get(),
             'scrub_metadata': self.scrub_meta_var.get()
         }
-        JSONStore.write_atomic(JSONStore.PREFS_FILE, data)
+        # Widget state is read above on the Tk thread; only the write is offloaded
+        _PREFS_POOL.submit(JSONStore.write_atomic, JSONStore.PREFS_FILE, data, True)
 
     def on_pane_motion(self, event=None):
         """Save pane position when the splitter is moved"""
@@ -998,20 +1600,93 @@ class PDFRedactorGUI:
             pos = self.main_paned.sashpos(0)
             if pos != self.last_pane_position:
                 self.last_pane_position = pos
-                # debounce save
-                if hasattr(self, '_pane_timer'):
-                    self.root.after_cancel(self._pane_timer)
-                self._pane_timer = self.root.after(500, self.save_prefs)
+                self._schedule_prefs_save()
         except Exception:
             pass
 
-    def schedule_preview_update(self):
-        """Refresh preview shortly if enabled"""
+    def _schedule_prefs_save(self, ms: int = 1000):
+        """Mark prefs dirty and write them once after ``ms`` without changes"""
+        self._prefs_dirty = True
+        if self._prefs_timer:
+            self.root.after_cancel(self._prefs_timer)
+        self._prefs_timer = self.root.after(ms, self._flush_prefs)
+
+    def _schedule_autosave_flush(self):
+        """Write any pending region snapshot at most once per AUTOSAVE_FLUSH_MS"""
+        if not self._autosave_timer:
+            self._autosave_timer = self.root.after(self.AUTOSAVE_FLUSH_MS, self._flush_autosave)
+
+    def _flush_autosave(self):
+        self._autosave_timer = None
+        if self.region_store:
+            self.region_store.flush_autosave()
+
+    def _flush_prefs(self):
+        self._prefs_timer = None
+        if self._prefs_dirty:
+            self._prefs_dirty = False
+            self.save_prefs()
+
+    def schedule_preview_update(self, delay: int = None):
+        """Refresh preview shortly if enabled, coalescing bursts of edits"""
         if not self.preview_var.get():
             return
-        if hasattr(self, '_preview_timer'):
-            self.root.after_cancel(self._preview_timer)
-        self._preview_timer = self.root.after(300, self.display_page)
+        if self._preview_after_id:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(delay or self.PREVIEW_DELAY_MS,
+                                                 self._maybe_refresh)
+
+    def _maybe_refresh(self):
+        self._preview_after_id = None
+        # display_page itself returns early if the render key is unchanged
+        self.display_page()
+
+    def _schedule_redraw(self):
+        """Redraw once the event queue is idle; region edits in a burst share one render"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.display_page()
+
+    def _debounce(self, attr: str, ms: int, fn):
+        """Run ``fn`` after ``ms`` of quiet, cancelling the timer stored in ``attr``"""
+        timer = getattr(self, attr, None)
+        if timer:
+            self.root.after_cancel(timer)
+        setattr(self, attr, self.root.after(ms, fn))
+
+    def _on_text_edit(self, widget: tk.Text, fn):
+        """Call ``fn`` on every edit to ``widget``.
+
+        Uses the Text widget's modified flag rather than <KeyRelease>, so
+        arrow keys, modifiers and selection changes don't trigger a re-sync.
+        ``fn`` runs per keystroke and must be cheap; it defers real work itself.
+        """
+        def on_modified(event):
+            if widget.edit_modified():
+                widget.edit_modified(False)
+                fn()
+        widget.bind('<<Modified>>', on_modified)
+
+    def _mark_passages_dirty(self, flag: str):
+        """Note a passages box edit; the text is parsed only when something reads it.
+
+        The flag is set at once so a save or export right after typing still
+        parses the box; only the preview refresh is debounced.
+        """
+        setattr(self, flag, True)
+        self._patterns_ui_fp = None
+        self.schedule_preview_update(self.PREVIEW_CONTINUOUS_DELAY_MS)
+
+    def _sync_from_ui(self):
+        """Parse any passage boxes edited since they were last read into the model"""
+        if self._patterns_dirty:
+            self.update_patterns_from_ui()
+        if self._exclusions_dirty:
+            self.update_exclusions_from_ui()
 
     # ---------------------- UI setup ---------------------------
     def setup_ui(self):
@@ -1039,68 +1714,75 @@ class PDFRedactorGUI:
         preset_menu.add_command(label="Save Current as Preset...", command=self.save_as_preset)
         preset_menu.add_command(label="Manage Presets...", command=self.manage_presets)
 
-        # Toolbar
+        # Toolbar - described as a table of (widget class, options, pack options,
+        # extra) rows, where extra is None, an attribute name to keep the widget
+        # under, or a list of child rows packed inside the widget
+        Button, Separator, Radiobutton, Checkbutton, Label, LabelFrame = (
+            ttk.Button, ttk.Separator, ttk.Radiobutton, ttk.Checkbutton, ttk.Label, ttk.LabelFrame)
+        LEFT = tk.LEFT
+
         toolbar = ttk.Frame(self.root)
         toolbar.pack(side=tk.TOP, fill=tk.X)
 
-        ttk.Button(toolbar, text='Open PDF', command=self.open_pdf).pack(side=tk.LEFT, padx=5)
-        ttk.Button(toolbar, text='Save Regions', command=self.save_regions).pack(side=tk.LEFT, padx=5)
-        ttk.Button(toolbar, text='Save Redacted', command=self.save_redacted).pack(side=tk.LEFT, padx=5)
-
-        ttk.Separator(toolbar, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=3)
-
-        # Tool mode buttons
-        tool_frame = ttk.LabelFrame(toolbar, text="Tool Mode")
-        tool_frame.pack(side=tk.LEFT, padx=5)
-
         self.tool_var = tk.StringVar(value=ToolMode.PAN.name)
-        ttk.Radiobutton(tool_frame, text="Pan (Space)", variable=self.tool_var,
-                        value=ToolMode.PAN.name, command=self.on_tool_change).pack(side=tk.LEFT)
-        ttk.Radiobutton(tool_frame, text="Text (T)", variable=self.tool_var,
-                        value=ToolMode.TEXT_SELECT.name, command=self.on_tool_change).pack(side=tk.LEFT)
-        ttk.Radiobutton(tool_frame, text="Draw (R/P)", variable=self.tool_var,
-                        value=ToolMode.DRAW_REDACT.name, command=self.on_tool_change).pack(side=tk.LEFT)
-        ttk.Radiobutton(tool_frame, text="Polygon (R/P)", variable=self.tool_var,
-                        value=ToolMode.DRAW_POLY_REDACT.name, command=self.on_tool_change).pack(side=tk.LEFT)
-
-        # Drawing mode toggle (redact vs protect)
-        draw_frame = ttk.LabelFrame(toolbar, text="Draw Mode")
-        draw_frame.pack(side=tk.LEFT, padx=5)
         self.mode_var = tk.StringVar(value='redact')
-        ttk.Radiobutton(draw_frame, text='Redact', variable=self.mode_var,
-                        value='redact', command=self.on_mode_change).pack(side=tk.LEFT)
-        ttk.Radiobutton(draw_frame, text='Protect', variable=self.mode_var,
-                        value='protect', command=self.on_mode_change).pack(side=tk.LEFT)
-
-        ttk.Separator(toolbar, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=3)
-
-        # Page navigation
-        ttk.Button(toolbar, text='< Prev', command=self.prev_page).pack(side=tk.LEFT)
-        ttk.Button(toolbar, text='Next >', command=self.next_page).pack(side=tk.LEFT)
-        self.page_label = ttk.Label(toolbar, text='No PDF')
-        self.page_label.pack(side=tk.LEFT, padx=10)
-
-        ttk.Separator(toolbar, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=3)
-
-        ttk.Button(toolbar, text='Undo', command=self.undo).pack(side=tk.LEFT)
-        ttk.Button(toolbar, text='Redo', command=self.redo).pack(side=tk.LEFT)
-
-        ttk.Separator(toolbar, orient='vertical').pack(side=tk.LEFT, fill=tk.Y, padx=3)
-
         self.preview_var = tk.BooleanVar()
-        ttk.Checkbutton(toolbar, text='Preview', variable=self.preview_var, command=self.display_page).pack(
-            side=tk.LEFT)
-
-        # OCR checkbox
-        ttk.Checkbutton(toolbar, text='Use OCR', variable=self.use_ocr,
-                        command=self.display_page,
-                        state='normal' if OCR_AVAILABLE else 'disabled').pack(side=tk.LEFT)
         self.scrub_meta_var = tk.BooleanVar()
-        ttk.Checkbutton(toolbar, text='Scrub Metadata', variable=self.scrub_meta_var).pack(side=tk.LEFT)
+        self.optimize_var = tk.BooleanVar(value=False)
         self.convert_img_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(toolbar, text='Convert Images', variable=self.convert_img_var).pack(side=tk.LEFT)
 
-        ttk.Button(toolbar, text='Help', command=self.show_help).pack(side=tk.RIGHT, padx=5)
+        sep = (Separator, dict(orient='vertical'), dict(side=LEFT, fill=tk.Y, padx=3), None)
+        # Radios carry the ToolMode itself; tool_var only drives the indicator
+        def tool_radio(mode):
+            return dict(value=mode.name, variable=self.tool_var,
+                        command=lambda m=mode: self.on_tool_change(m))
+        mode_radio = dict(variable=self.mode_var, command=self.on_mode_change)
+        TOOLBAR_SPEC = [
+            (Button, dict(text='Open PDF', command=self.open_pdf), dict(side=LEFT, padx=5), None),
+            (Button, dict(text='Save Regions', command=self.save_regions), dict(side=LEFT, padx=5), None),
+            (Button, dict(text='Save Redacted', command=self.save_redacted), dict(side=LEFT, padx=5), None),
+            sep,
+            # Tool mode buttons
+            (LabelFrame, dict(text="Tool Mode"), dict(side=LEFT, padx=5), [
+                (Radiobutton, dict(text="Pan (Space)", **tool_radio(ToolMode.PAN)), dict(side=LEFT)),
+                (Radiobutton, dict(text="Text (T)", **tool_radio(ToolMode.TEXT_SELECT)), dict(side=LEFT)),
+                (Radiobutton, dict(text="Draw (R/P)", **tool_radio(ToolMode.DRAW_REDACT)), dict(side=LEFT)),
+                (Radiobutton, dict(text="Polygon (R/P)", **tool_radio(ToolMode.DRAW_POLY_REDACT)),
+                 dict(side=LEFT)),
+            ]),
+            # Drawing mode toggle (redact vs protect)
+            (LabelFrame, dict(text="Draw Mode"), dict(side=LEFT, padx=5), [
+                (Radiobutton, dict(text='Redact', value='redact', **mode_radio), dict(side=LEFT)),
+                (Radiobutton, dict(text='Protect', value='protect', **mode_radio), dict(side=LEFT)),
+            ]),
+            sep,
+            # Page navigation
+            (Button, dict(text='< Prev', command=self.prev_page), dict(side=LEFT), None),
+            (Button, dict(text='Next >', command=self.next_page), dict(side=LEFT), None),
+            (Label, dict(text='No PDF'), dict(side=LEFT, padx=10), 'page_label'),
+            sep,
+            (Button, dict(text='Undo', command=self.undo), dict(side=LEFT), None),
+            (Button, dict(text='Redo', command=self.redo), dict(side=LEFT), None),
+            sep,
+            (Checkbutton, dict(text='Preview', variable=self.preview_var, command=self.display_page),
+             dict(side=LEFT), None),
+            (Checkbutton, dict(text='Use OCR', variable=self.use_ocr, command=self.display_page,
+                               state='normal' if OCR_AVAILABLE else 'disabled'), dict(side=LEFT), None),
+            (Checkbutton, dict(text='Scrub Metadata', variable=self.scrub_meta_var,
+                               command=self._schedule_prefs_save), dict(side=LEFT), None),
+            (Checkbutton, dict(text='Optimize Size', variable=self.optimize_var), dict(side=LEFT), None),
+            (Checkbutton, dict(text='Convert Images', variable=self.convert_img_var,
+                               command=self._schedule_prefs_save), dict(side=LEFT), None),
+            (Button, dict(text='Help', command=self.show_help), dict(side=tk.RIGHT, padx=5), None),
+        ]
+        for cls, kw, pk, extra in TOOLBAR_SPEC:
+            widget = cls(toolbar, **kw)
+            widget.pack(**pk)
+            if isinstance(extra, str):
+                setattr(self, extra, widget)
+            elif extra:
+                for child_cls, child_kw, child_pk in extra:
+                    child_cls(widget, **child_kw).pack(**child_pk)
 
         # Main area with resizable panes
         self.main_paned = ttk.Panedwindow(self.root, orient=tk.HORIZONTAL)
@@ -1125,6 +1807,9 @@ class PDFRedactorGUI:
 
         # Canvas area
         self.canvas = PDFCanvas(canvas_frame)
+        # Bound scroll methods, looked up once for the wheel handler
+        self._wheel_x = self.canvas.xview_scroll
+        self._wheel_y = self.canvas.yview_scroll
 
         # Bind canvas events
         self.canvas.bind('<ButtonPress-1>', self.on_canvas_press)
@@ -1142,11 +1827,11 @@ class PDFRedactorGUI:
         self.canvas.bind('<Button-5>', self.on_mousewheel)
 
         # Side notebook
-        notebook = ttk.Notebook(side_frame)
+        self.notebook = notebook = ttk.Notebook(side_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
 
         tab_pats = ttk.Frame(notebook)
-        tab_exc = ttk.Frame(notebook)
+        self.tab_exc = tab_exc = ttk.Frame(notebook)
         tab_regs = ttk.Frame(notebook)
         tab_presets = ttk.Frame(notebook)
 
@@ -1155,15 +1840,34 @@ class PDFRedactorGUI:
         notebook.add(tab_regs, text='Regions')
         notebook.add(tab_presets, text='Presets')
 
+        # Only the initially visible tab is built now; the others are built
+        # the first time they are shown (or when their widgets are needed)
         self.create_patterns_tab(tab_pats)
-        self.create_exclusions_tab(tab_exc)
-        self.create_regions_tab(tab_regs)
-        self.create_presets_tab(tab_presets)
+        self._tab_builders = {}
+        for tab, builder in [(tab_exc, self.create_exclusions_tab),
+                             (tab_regs, self.create_regions_tab),
+                             (tab_presets, self.create_presets_tab)]:
+            placeholder = ttk.Label(tab, text="Loading…")
+            placeholder.pack(pady=10)
+            self._tab_builders[str(tab)] = (tab, builder, placeholder)
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_shown)
 
         # Status bar
         self.status_bar = ttk.Label(self.root, text="Ready", relief=tk.SUNKEN)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
+    def _on_tab_shown(self, event=None):
+        """Build the selected notebook tab on first display"""
+        self._ensure_tab(self.notebook.select())
+
+    def _ensure_tab(self, tab):
+        """Build ``tab`` now if it is still waiting for its first display"""
+        entry = self._tab_builders.pop(str(tab), None)
+        if entry:
+            frame, builder, placeholder = entry
+            placeholder.destroy()
+            builder(frame)
+
     def create_patterns_tab(self, parent):
         ttk.Label(parent, text='Keywords:').pack(anchor='w')
 
@@ -1192,8 +1896,7 @@ class PDFRedactorGUI:
         ttk.Label(parent, text='Passages (separate with ---):').pack(anchor='w', pady=(10, 0))
         self.passages_txt = scrolledtext.ScrolledText(parent, height=8)
         self.passages_txt.pack(fill=tk.BOTH, expand=True, padx=5)
-        self.passages_txt.bind('<KeyRelease>',
-                               lambda e: (self.update_patterns_from_ui(), self.schedule_preview_update()))
+        self._on_text_edit(self.passages_txt, lambda: self._mark_passages_dirty('_patterns_dirty'))
 
         ttk.Button(parent, text='Save Patterns', command=self.save_patterns).pack(pady=5)
 
@@ -1230,15 +1933,15 @@ class PDFRedactorGUI:
         ttk.Label(parent, text='Excluded Passages (--- separated):').pack(anchor='w', pady=(10, 0))
         self.excluded_passages_txt = scrolledtext.ScrolledText(parent, height=8)
         self.excluded_passages_txt.pack(fill=tk.BOTH, expand=True, padx=5)
-        self.excluded_passages_txt.bind('<KeyRelease>',
-                                        lambda e: (self.update_exclusions_from_ui(), self.schedule_preview_update()))
+        self._on_text_edit(self.excluded_passages_txt,
+                           lambda: self._mark_passages_dirty('_exclusions_dirty'))
 
         pass_btn_frame = ttk.Frame(parent)
         pass_btn_frame.pack(fill=tk.X, padx=5, pady=5)
         ttk.Button(pass_btn_frame, text='Add Passage from Selection',
                    command=self.add_excluded_passage_from_selection).pack(side=tk.LEFT, padx=2)
         ttk.Button(pass_btn_frame, text='Clear Passages',
-                   command=lambda: self.excluded_passages_txt.delete(1.0, tk.END)).pack(side=tk.LEFT, padx=2)
+                   command=self.clear_excluded_passages).pack(side=tk.LEFT, padx=2)
 
         ttk.Button(parent, text='Save Exclusions', command=self.save_exclusions).pack(pady=5)
 
@@ -1246,6 +1949,16 @@ class PDFRedactorGUI:
         self.update_excluded_passages_ui()
 
     def create_regions_tab(self, parent):
+        filter_frame = ttk.Frame(parent)
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(filter_frame, text='Show:').pack(side=tk.LEFT, padx=5)
+        # Listing only the page on screen keeps the tree small on heavily marked documents
+        self.region_filter_var = tk.StringVar(value='Current page')
+        region_filter = ttk.Combobox(filter_frame, textvariable=self.region_filter_var,
+                                     values=('Current page', 'All pages'), state='readonly', width=14)
+        region_filter.pack(side=tk.LEFT)
+        region_filter.bind('<<ComboboxSelected>>', lambda e: self.refresh_region_tree())
+
         columns = ('page', 'x1', 'y1', 'x2', 'y2', 'kind')
         self.region_tree = ttk.Treeview(parent, columns=columns, show='headings', selectmode='browse', height=10)
         for col in columns:
@@ -1276,7 +1989,8 @@ class PDFRedactorGUI:
     def create_presets_tab(self, parent):
         """Create the presets tab UI."""
         # Current preset label
-        self.preset_label = ttk.Label(parent, text="No preset active",
+        label = f"Active preset: {self.current_preset}" if self.current_preset else "No preset active"
+        self.preset_label = ttk.Label(parent, text=label,
                                       font=('TkDefaultFont', 10, 'bold'))
         self.preset_label.pack(pady=10)
 
@@ -1319,9 +2033,11 @@ class PDFRedactorGUI:
 
     def update_preset_list(self):
         """Update the preset listbox."""
+        if not hasattr(self, 'preset_listbox'):
+            return  # populated when the Presets tab is built
         self.preset_listbox.delete(0, tk.END)
-        for name in sorted(self.presets.keys()):
-            self.preset_listbox.insert(tk.END, name)
+        if self._sorted_preset_names:
+            self.preset_listbox.insert(tk.END, *self._sorted_preset_names)
 
     def on_preset_select(self, event):
         """Handle preset selection."""
@@ -1330,29 +2046,47 @@ class PDFRedactorGUI:
             preset_name = self.preset_listbox.get(selection[0])
             preset = self.presets.get(preset_name, {})
 
-            # Show preset details
-            details = f"Name: {preset.get('name', preset_name)}\n\n"
-            details += f"Description: {preset.get('description', 'No description')}\n\n"
+            key = (preset_name, id(preset))
+            details = self._preset_details_cache.get(key)
+            if details is None:
+                details = self._render_preset_details(preset_name, preset)
+                self._preset_details_cache[key] = details
+                if len(self._preset_details_cache) > self.PRESET_DETAILS_CACHE_SIZE:
+                    self._preset_details_cache.popitem(last=False)
+            else:
+                self._preset_details_cache.move_to_end(key)
 
-            patterns = preset.get('patterns', {})
-            if patterns.get('keywords'):
-                details += f"Keywords: {', '.join(patterns['keywords'][:5])}"
-                if len(patterns['keywords']) > 5:
-                    details += f" ... ({len(patterns['keywords'])} total)"
-                details += "\n\n"
+            self.preset_details.delete(1.0, tk.END)
+            self.preset_details.insert(1.0, details)
 
-            if patterns.get('passages'):
-                details += f"Passages: {len(patterns['passages'])} defined\n\n"
+    def _render_preset_details(self, preset_name: str, preset: dict) -> str:
+        """Build the details text shown for a preset."""
+        details = f"Name: {preset.get('name', preset_name)}\n\n"
+        details += f"Description: {preset.get('description', 'No description')}\n\n"
 
-            if preset.get('regex_patterns'):
-                details += f"Regex Patterns: {len(preset['regex_patterns'])} defined\n"
-                for i, pattern in enumerate(preset['regex_patterns'][:3]):
-                    details += f"  {i + 1}. {pattern}\n"
-                if len(preset['regex_patterns']) > 3:
-                    details += f"  ... ({len(preset['regex_patterns'])} total)\n"
+        patterns = preset.get('patterns', {})
+        if patterns.get('keywords'):
+            details += f"Keywords: {', '.join(patterns['keywords'][:5])}"
+            if len(patterns['keywords']) > 5:
+                details += f" ... ({len(patterns['keywords'])} total)"
+            details += "\n\n"
 
-            self.preset_details.delete(1.0, tk.END)
-            self.preset_details.insert(1.0, details)
+        if patterns.get('passages'):
+            details += f"Passages: {len(patterns['passages'])} defined\n\n"
+
+        if preset.get('regex_patterns'):
+            details += f"Regex Patterns: {len(preset['regex_patterns'])} defined\n"
+            for i, pattern in enumerate(preset['regex_patterns'][:3]):
+                details += f"  {i + 1}. {pattern}\n"
+            if len(preset['regex_patterns']) > 3:
+                details += f"  ... ({len(preset['regex_patterns'])} total)\n"
+
+        return details
+
+    def _invalidate_preset_details(self, preset_name: str):
+        """Drop cached details for every entry of ``preset_name``."""
+        for key in [k for k in self._preset_details_cache if k[0] == preset_name]:
+            del self._preset_details_cache[key]
 
     def apply_preset(self, preset_name: str):
         """Apply a preset configuration."""
@@ -1360,14 +2094,19 @@ class PDFRedactorGUI:
         if not preset:
             return
 
-        # Apply patterns
-        self.patterns = preset.get('patterns', {'keywords': [], 'passages': []}).copy()
+        self._invalidate_preset_details(preset_name)
+
+        # Apply patterns (copy the lists too; they are edited in place later)
+        preset_patterns = preset.get('patterns', {})
+        self.patterns = {'keywords': list(preset_patterns.get('keywords', [])),
+                         'passages': list(preset_patterns.get('passages', []))}
         self.regex_patterns = preset.get('regex_patterns', []).copy()
 
         # Update UI
         self.update_patterns_ui()
         self.current_preset = preset_name
-        self.preset_label.config(text=f"Active preset: {preset_name}")
+        if hasattr(self, 'preset_label'):
+            self.preset_label.config(text=f"Active preset: {preset_name}")
 
         # Update display
         self.schedule_preview_update()
@@ -1402,6 +2141,7 @@ class PDFRedactorGUI:
                 return
 
             # Create preset
+            self._sync_from_ui()
             preset = {
                 'name': name,
                 'description': desc_text.get(1.0, tk.END).strip(),
@@ -1411,7 +2151,10 @@ class PDFRedactorGUI:
             }
 
             # Save to presets
+            if name not in self.presets:
+                bisect.insort(self._sorted_preset_names, name)
             self.presets[name] = preset
+            self._invalidate_preset_details(name)
             JSONStore.save_presets(self.presets)
 
             # Update UI
@@ -1441,6 +2184,8 @@ class PDFRedactorGUI:
         if messagebox.askyesno("Confirm Delete",
                                f"Delete preset '{preset_name}'?"):
             del self.presets[preset_name]
+            self._sorted_preset_names.remove(preset_name)
+            self._invalidate_preset_details(preset_name)
             JSONStore.save_presets(self.presets)
             self.update_preset_list()
             self.preset_details.delete(1.0, tk.END)
@@ -1458,41 +2203,88 @@ class PDFRedactorGUI:
 
     def update_patterns_ui(self):
         """Update patterns UI elements"""
+        self._kw_set = set(self.patterns.get('keywords', []))
+        fp = hash((tuple(self.patterns.get('keywords', [])), tuple(self.patterns.get('passages', []))))
+        if fp == self._patterns_ui_fp:
+            return
+        self._patterns_ui_fp = fp
+
         self.keywords_lb.delete(0, tk.END)
-        for kw in self.patterns.get('keywords', []):
-            self.keywords_lb.insert(tk.END, kw)
+        # Insert all items in one Tcl call rather than one call per keyword
+        keywords = list(self.patterns.get('keywords', []))
+        if keywords:
+            self.keywords_lb.insert(tk.END, *keywords)
 
-        self.passages_txt.delete(1.0, tk.END)
-        self.passages_txt.insert(tk.END, '\n---\n'.join(self.patterns.get('passages', [])))
+        self._set_text(self.passages_txt, '\n---\n'.join(self.patterns.get('passages', [])))
+        self._patterns_dirty = False
 
     def update_exclusions_ui(self):
         """Update exclusions UI elements"""
+        self._excl_set = set(self.exclusions)
+        if not hasattr(self, 'excl_lb'):
+            return  # populated when the Exclusions tab is built
         self.excl_lb.delete(0, tk.END)
-        for ex in self.exclusions:
-            self.excl_lb.insert(tk.END, ex)
+        if self.exclusions:
+            self.excl_lb.insert(tk.END, *self.exclusions)
         if hasattr(self, 'excluded_passages_txt'):
-            self.excluded_passages_txt.delete(1.0, tk.END)
-            self.excluded_passages_txt.insert(tk.END, '\n---\n'.join(self.excluded_passages))
+            self._set_text(self.excluded_passages_txt, '\n---\n'.join(self.excluded_passages))
+            self._exclusions_dirty = False
 
     def update_excluded_passages_ui(self):
         """Update excluded passages UI"""
-        self.excluded_passages_txt.delete(1.0, tk.END)
-        self.excluded_passages_txt.insert(tk.END, '\n---\n'.join(self.excluded_passages))
+        self._set_text(self.excluded_passages_txt, '\n---\n'.join(self.excluded_passages))
+        self._exclusions_dirty = False
+
+    @staticmethod
+    def _set_text(widget: tk.Text, text: str):
+        """Replace the whole contents of a Text widget in one edit"""
+        if hasattr(widget, 'replace'):
+            widget.replace(1.0, tk.END, text)
+        else:
+            widget.delete(1.0, tk.END)
+            widget.insert(tk.END, text)
+        # Programmatic fills are already in sync; don't report them as user edits
+        widget.edit_modified(False)
 
     # -------- region management tab ---------
     def refresh_region_tree(self):
         if not hasattr(self, 'region_tree'):
             return
-        self.region_tree.delete(*self.region_tree.get_children())
-        if not self.region_store:
-            return
-        for kind, data in [('redact', self.region_store.regions), ('protect', self.region_store.protect)]:
-            for page_str, regs in data.items():
-                page = int(page_str)
-                for idx, (x1, y1, x2, y2) in enumerate(regs):
-                    iid = f"{kind}-{page}-{idx}"
-                    self.region_tree.insert('', 'end', iid=iid,
-                                            values=(page, f"{x1:.1f}", f"{y1:.1f}", f"{x2:.1f}", f"{y2:.1f}", kind))
+        store = self.region_store
+        current_only = self.region_filter_var.get() == 'Current page'
+        # Collect every listed row in one pass
+        rows = [
+            (self._pack_region_iid(kind, int(page_str), idx),
+             (int(page_str), f"{x1:.1f}", f"{y1:.1f}", f"{x2:.1f}", f"{y2:.1f}", kind))
+            for kind, data in (('redact', store.regions), ('protect', store.protect))
+            for page_str, regs in (((self._page_key, data.get(self._page_key, [])),)
+                                   if current_only else data.items())
+            for idx, (x1, y1, x2, y2) in enumerate(regs)
+        ] if store else []
+        # Only touch rows that changed; most refreshes (page flips, redraws) touch none
+        tree, old = self.region_tree, self._tree_state
+        new = dict(rows)
+        stale = [iid for iid in old if iid not in new]
+        if stale:
+            tree.delete(*stale)
+        for pos, (iid, values) in enumerate(rows):
+            prev = old.get(iid)
+            if prev is None:
+                tree.insert('', pos, iid=iid, values=values)
+            elif prev != values:
+                tree.item(iid, values=values)
+        self._tree_state = new
+
+    @staticmethod
+    def _pack_region_iid(kind: str, page: int, index: int) -> str:
+        """Encode (kind, page, index) as one integer tree iid"""
+        return str((kind == 'protect') << 48 | page << 24 | index)
+
+    @staticmethod
+    def _unpack_region_iid(iid: str) -> tuple[str, int, int]:
+        """Decode a tree iid made by ``_pack_region_iid``"""
+        v = int(iid)
+        return ('protect' if v >> 48 else 'redact'), (v >> 24) & 0xFFFFFF, v & 0xFFFFFF
 
     def on_region_select(self, event=None):
         sel = self.region_tree.selection()
@@ -1513,99 +2305,154 @@ class PDFRedactorGUI:
         sel = self.region_tree.selection()
         if not sel:
             return
-        iid = sel[0]
-        kind, page, index = iid.split('-')
+        kind, page, index = self._unpack_region_iid(sel[0])
         bbox = [self.x1_var.get(), self.y1_var.get(), self.x2_var.get(), self.y2_var.get()]
-        if self.region_store.update(int(page), int(index), bbox, kind=kind):
+        if self.region_store.update(page, index, bbox, kind=kind):
             self.refresh_region_tree()
-            self.display_page()
+            self._schedule_redraw()
 
     def delete_selected_region(self):
         if not self.region_store:
             return
         sel = list(self.region_tree.selection())
         for iid in sel:
-            kind, page, index = iid.split('-')
-            self.region_store.remove(int(page), int(index), kind)
+            kind, page, index = self._unpack_region_iid(iid)
+            self.region_store.remove(page, index, kind)
         self.refresh_region_tree()
-        self.display_page()
+        self._schedule_redraw()
 
     def update_patterns_from_ui(self):
         """Sync pattern data from widgets"""
+        # The widgets were edited directly, so they no longer match the fingerprint
+        self._patterns_ui_fp = None
+        self._patterns_dirty = False
+        raw = self.passages_txt.get(1.0, tk.END)
+        # Keyed on the text itself: equal hashes alone don't mean equal text
+        cached = getattr(self, '_pat_raw_cache', None)
+        if cached and cached[0] == raw:
+            passages = cached[1]
+        else:
+            passages = [p.strip() for p in _PASSAGE_SPLIT.split(raw) if p.strip()]
+            self._pat_raw_cache = (raw, passages)
         self.patterns = {
             'keywords': list(self.keywords_lb.get(0, tk.END)),
-            'passages': [p.strip() for p in self.passages_txt.get(1.0, tk.END).split('\n---\n') if p.strip()]
+            'passages': list(passages)
         }
+        self._kw_set = set(self.patterns['keywords'])
 
     def update_exclusions_from_ui(self):
         """Sync exclusion data from widgets"""
         self.exclusions = list(self.excl_lb.get(0, tk.END))
-        self.excluded_passages = [p.strip() for p in self.excluded_passages_txt.get(1.0, tk.END).split('\n---\n') if
-                                  p.strip()]
+        self._exclusions_dirty = False
+        raw = self.excluded_passages_txt.get(1.0, tk.END)
+        cached = getattr(self, '_exc_raw_cache', None)
+        if cached and cached[0] == raw:
+            passages = cached[1]
+        else:
+            passages = [p.strip() for p in _PASSAGE_SPLIT.split(raw) if p.strip()]
+            self._exc_raw_cache = (raw, passages)
+        self.excluded_passages = list(passages)
+        self._excl_set = set(self.exclusions)
 
     def _add_keyword(self):
         text = self.kw_entry.get().strip()
         if text:
-            self.keywords_lb.insert(tk.END, text)
             self.kw_entry.delete(0, tk.END)
-            self.update_patterns_from_ui()
+            if text in self._kw_set:
+                return
+            # Update model and widget incrementally; no read-back of the listbox
+            self._patterns_ui_fp = None
+            self._kw_set.add(text)
+            self.patterns.setdefault('keywords', []).append(text)
+            self.keywords_lb.insert(tk.END, text)
             self.schedule_preview_update()
 
     def _add_exclusion(self):
         text = self.exc_entry.get().strip()
         if text:
-            self.excl_lb.insert(tk.END, text)
             self.exc_entry.delete(0, tk.END)
-            self.update_exclusions_from_ui()
+            if text in self._excl_set:
+                return
+            self._excl_set.add(text)
+            self.exclusions.append(text)
+            self.excl_lb.insert(tk.END, text)
             self.schedule_preview_update()
 
     def _del_listbox_item(self, listbox: tk.Listbox):
+        if listbox == self.keywords_lb:
+            self._patterns_ui_fp = None
+            items = self.patterns.setdefault('keywords', [])
+        elif listbox == self.excl_lb:
+            items = self.exclusions
+        else:
+            items = None
         sel = list(listbox.curselection())
         for i in reversed(sel):
             listbox.delete(i)
+            if items is not None and i < len(items):
+                del items[i]
         if listbox == self.keywords_lb:
-            self.update_patterns_from_ui()
+            self._kw_set = set(items)
         elif listbox == self.excl_lb:
-            self.update_exclusions_from_ui()
+            self._excl_set = set(items)
         self.schedule_preview_update()
 
+    def _toast(self, text: str, ms: int = 2500):
+        """Show a warning in the status bar for ``ms``; unlike a messagebox it doesn't block"""
+        self.status_bar.config(text=text, foreground='red')
+
+        def clear():
+            # Leave any newer status message in place, just uncoloured
+            if self.status_bar.cget('text') == text:
+                self.status_bar.config(text="Ready")
+            self.status_bar.config(foreground='')
+        self._debounce('_toast_timer', ms, clear)
+
+    def _require_text_select(self) -> bool:
+        """True if there is selected text to add; otherwise say what's missing"""
+        if self.current_tool != ToolMode.TEXT_SELECT:
+            self._toast("Switch to Text Selection mode (T) and select text first")
+            return False
+        if not self.last_selected_text:
+            self._toast("No text selected. Use Text Selection tool to select text first.")
+            return False
+        return True
+
     def add_exclusion_from_selection(self):
         """Add selected text to exclusions"""
-        if self.current_tool != ToolMode.TEXT_SELECT:
-            messagebox.showinfo("Info", "Switch to Text Selection mode (T) and select text first")
+        if not self._require_text_select():
             return
-
-        # Get last selected text if any
-        if hasattr(self, 'last_selected_text') and self.last_selected_text:
-            self.excl_lb.insert(tk.END, self.last_selected_text)
-            self.status_bar.config(text=f"Added to exclusions: {self.last_selected_text[:50]}...")
-            self.update_exclusions_from_ui()
-            self.schedule_preview_update()
-        else:
-            messagebox.showinfo("Info", "No text selected. Use Text Selection tool to select text first.")
+        self.excl_lb.insert(tk.END, self.last_selected_text)
+        self.status_bar.config(text=f"Added to exclusions: {self.last_selected_text[:50]}...")
+        self.update_exclusions_from_ui()
+        self.schedule_preview_update()
 
     def add_excluded_passage_from_selection(self):
         """Add selected text to excluded passages"""
-        if self.current_tool != ToolMode.TEXT_SELECT:
-            messagebox.showinfo("Info", "Switch to Text Selection mode (T) and select text first")
+        if not self._require_text_select():
             return
+        # Add to text area with separator if not empty
+        current = self.excluded_passages_txt.get(1.0, tk.END).strip()
+        if current:
+            self.excluded_passages_txt.insert(tk.END, '\n---\n')
+        self.excluded_passages_txt.insert(tk.END, self.last_selected_text)
+        self.status_bar.config(text=f"Added to excluded passages: {self.last_selected_text[:50]}...")
+        self.update_exclusions_from_ui()
+        self.schedule_preview_update()
 
-        if hasattr(self, 'last_selected_text') and self.last_selected_text:
-            # Add to text area with separator if not empty
-            current = self.excluded_passages_txt.get(1.0, tk.END).strip()
-            if current:
-                self.excluded_passages_txt.insert(tk.END, '\n---\n')
-            self.excluded_passages_txt.insert(tk.END, self.last_selected_text)
-            self.status_bar.config(text=f"Added to excluded passages: {self.last_selected_text[:50]}...")
-            self.update_exclusions_from_ui()
-            self.schedule_preview_update()
-        else:
-            messagebox.showinfo("Info", "No text selected. Use Text Selection tool to select text first.")
+    def clear_excluded_passages(self):
+        """Empty the excluded passages box"""
+        self._set_text(self.excluded_passages_txt, '')
+        # _set_text isn't reported as a user edit, so flag the box for re-parsing here
+        self._mark_passages_dirty('_exclusions_dirty')
 
     def set_tool_mode(self, mode: ToolMode):
         """Set the current tool mode"""
+        if mode is self.current_tool:
+            return
         self.current_tool = mode
-        self.tool_var.set(mode.name)
+        if self.tool_var.get() != mode.name:
+            self.tool_var.set(mode.name)
         self.canvas.set_tool_mode(mode)
 
         # Update status bar
@@ -1619,11 +2466,8 @@ class PDFRedactorGUI:
         }
         self.status_bar.config(text=mode_names.get(mode, ""))
 
-    def on_tool_change(self):
+    def on_tool_change(self, mode: ToolMode):
         """Handle tool mode change from radio buttons"""
-        mode_name = self.tool_var.get()
-        mode = ToolMode[mode_name]
-
         # If switching to draw mode, set appropriate drawing mode
         if mode in (ToolMode.DRAW_REDACT, ToolMode.DRAW_POLY_REDACT):
             self.mode_var.set('redact')
@@ -1660,6 +2504,14 @@ class PDFRedactorGUI:
             self.start_draw(event)
 
     def on_canvas_drag(self, event):
+        # Coalesce motion events to one update per frame; only the latest position matters
+        self._last_drag_event = event
+        if self._drag_pending is None:
+            self._drag_pending = self.root.after(self.DRAG_FRAME_MS, self._process_drag)
+
+    def _process_drag(self):
+        self._drag_pending = None
+        event = self._last_drag_event
         if self.current_tool == ToolMode.PAN:
             self.canvas.drag_pan(event)
         elif self.current_tool == ToolMode.TEXT_SELECT:
@@ -1669,6 +2521,10 @@ class PDFRedactorGUI:
             self.update_draw(event)
 
     def on_canvas_release(self, event):
+        if self._drag_pending is not None:
+            # Apply the last motion before finishing the gesture
+            self.root.after_cancel(self._drag_pending)
+            self._process_drag()
         if self.current_tool == ToolMode.TEXT_SELECT:
             text = self.canvas.end_text_selection(event)
             if text:
@@ -1714,12 +2570,14 @@ class PDFRedactorGUI:
         dialog.destroy()
 
     def _add_to_exclusions(self, text, dialog):
+        self._ensure_tab(self.tab_exc)
         self.excl_lb.insert(tk.END, text)
         self.update_exclusions_from_ui()
         self.schedule_preview_update()
         dialog.destroy()
 
     def _add_to_excluded_passages(self, text, dialog):
+        self._ensure_tab(self.tab_exc)
         current = self.excluded_passages_txt.get(1.0, tk.END).strip()
         if current:
             self.excluded_passages_txt.insert(tk.END, '\n---\n')
@@ -1730,63 +2588,73 @@ class PDFRedactorGUI:
 
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""
+        state = event.state
         # Check if Ctrl is held - if so, let the zoom handler deal with it
-        if event.state & 0x0004:  # Control key
+        if state & 0x0004:  # Control key
             return
-
-        # Horizontal scrolling when Shift is held or tilt wheel
-        if event.state & 0x0001 or getattr(event, 'num', None) in (6, 7):
-            if event.delta:
-                self.canvas.xview_scroll(int(-1 * (event.delta / 120)), 'units')
-            else:
-                if event.num in (6,):
-                    self.canvas.xview_scroll(-1, 'units')
-                elif event.num in (7,):
-                    self.canvas.xview_scroll(1, 'units')
+        num = event.num
+        delta = event.delta
+        # X11 reports wheel steps as buttons 4-7 with no delta
+        units = int(-delta / 120) if delta else self._WHEEL_BUTTON_UNITS.get(num, 0)
+        if not units:
             return
-
-        # Vertical scrolling
-        if event.delta:
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), 'units')
-        else:
-            if event.num == 4:
-                self.canvas.yview_scroll(-1, 'units')
-            elif event.num == 5:
-                self.canvas.yview_scroll(1, 'units')
+        # Horizontal scrolling when Shift is held or tilt wheel
+        scroll = self._wheel_x if state & 0x0001 or num in self._WHEEL_TILT_BUTTONS else self._wheel_y
+        scroll(units, 'units')
 
     # --------------------- Navigation & Undo -------------------
     def prev_page(self, *args):
         if self.doc and self.current_page > 0:
-            self.current_page -= 1
+            self._set_page(self.current_page - 1)
             self.display_page()
 
     def next_page(self, *args):
-        if self.doc and self.current_page < len(self.doc) - 1:
-            self.current_page += 1
+        if self.doc and self.current_page < self._page_count - 1:
+            self._set_page(self.current_page + 1)
             self.display_page()
 
-    def zoom_in(self, *args):
-        self.canvas.scale = min(self.canvas.scale * 1.1, 10.0)
+    def _set_page(self, page: int):
+        """Single place that changes the current page (keeps its dict key in sync)"""
+        self.current_page = page
+        self._page_key = str(page)
+
+    def _set_zoom(self, scale: float):
+        """Single place that changes the zoom level"""
+        # Snap to a fixed grid so zooming in and back out lands on exactly the
+        # same scale (2.2 / 1.1 is 2.0000000000000004) and hits the render caches
+        scale = round(scale, self.ZOOM_DECIMALS)
+        self.canvas.scale = self.last_zoom = scale
         self.display_page()
-        self.save_prefs()
+        # Wheel zooms arrive in bursts; write once shortly after the last tick
+        self._schedule_prefs_save(500)
+
+    def zoom_in(self, *args):
+        self._set_zoom(min(self.canvas.scale * 1.1, 10.0))
 
     def zoom_out(self, *args):
-        self.canvas.scale = max(self.canvas.scale / 1.1, 0.2)
-        self.display_page()
-        self.save_prefs()
+        self._set_zoom(max(self.canvas.scale / 1.1, 0.2))
 
     def zoom_reset(self, *args):
-        self.canvas.scale = 1.0
-        self.display_page()
-        self.save_prefs()
+        self._set_zoom(1.0)
 
     def undo(self, *args):
-        if self.region_store and self.region_store.undo():
-            self.display_page()
+        if self.region_store:
+            self._history_changed(self.region_store.undo())
+            self._schedule_autosave_flush()
 
     def redo(self, *args):
-        if self.region_store and self.region_store.redo():
+        if self.region_store:
+            self._history_changed(self.region_store.redo())
+            self._schedule_autosave_flush()
+
+    def _history_changed(self, page: Optional[int]):
+        """Re-render only if an undo/redo touched the page on screen"""
+        if page is None:
+            return
+        if page == self.current_page:
             self.display_page()
+        else:
+            self.refresh_region_tree()
 
     def save_regions(self):
         if self.region_store:
@@ -1838,12 +2706,23 @@ FEATURES:
         except Exception:
             messagebox.showerror('Error', 'Unsupported file type')
             return
-        self.doc = fitz.open(pdf_path)
-        self.current_page = 0
+        new_doc = fitz.open(pdf_path)
+        if self.doc:
+            self.doc.close()
+        self.doc = new_doc
+        self.canvas.clear_page_cache()
+        # Empty MuPDF's global store of fonts/images decoded for the previous document
+        fitz.TOOLS.store_shrink(100)
+        self._dirty = True
+        self._page_count = self.doc.page_count
+        self._set_page(0)
         stem = Path(filename).stem
+        if self.region_store:
+            self.region_store.flush_autosave()
         self.region_store = RegionStore.load(stem)
-        self.page_label.config(text=f"1 / {len(self.doc)}")
+        self.page_label.config(text=f"1 / {self._page_count}")
         self.last_pdf = filename
+        self._schedule_prefs_save()
 
         # Check if PDF appears to be scanned
         if self.canvas.ocr_processor.ocr_available:
@@ -1854,14 +2733,42 @@ FEATURES:
 
         self.display_page()
 
+    def _render_key(self) -> tuple:
+        """Everything the rendered page depends on; equal keys mean an identical render"""
+        store = self.region_store
+        preview = self.preview_var.get()
+        key = (self.current_page, self.canvas.scale, store.revision if store else None,
+               preview, self.use_ocr.get())
+        if preview:
+            # Only the preview reads patterns, so typing with it off never parses
+            self._sync_from_ui()
+            # The lists themselves, not a hash of them: a collision would leave
+            # a stale preview on screen (and serve it from the photo cache)
+            key += (tuple(self.patterns.get('keywords', [])),
+                    tuple(self.patterns.get('passages', [])),
+                    tuple(self.exclusions), tuple(self.excluded_passages),
+                    tuple(self.regex_patterns))
+        return key
+
     def display_page(self):
         if not self.doc:
             return
+        # MuPDF is not thread-safe; while Save Redacted runs, the Tk thread leaves
+        # it alone and the page is redrawn once the save finishes
+        if self._save_thread is not None:
+            self._dirty = True
+            return
+        # Skip the render when nothing it depends on changed since the last one
+        key = self._render_key()
+        if not self._dirty and key == self._last_render_key:
+            return
+        self._dirty = False
+        self._last_render_key = key
         p = self.doc[self.current_page]
-        regs = self.region_store.regions.get(str(self.current_page), []) if self.region_store else []
-        prot = self.region_store.protect.get(str(self.current_page), []) if self.region_store else []
-        polys = self.region_store.polygons.get(str(self.current_page), []) if self.region_store else []
-        prot_polys = self.region_store.protect_polygons.get(str(self.current_page), []) if self.region_store else []
+        regs = self.region_store.regions.get(self._page_key, []) if self.region_store else []
+        prot = self.region_store.protect.get(self._page_key, []) if self.region_store else []
+        polys = self.region_store.polygons.get(self._page_key, []) if self.region_store else []
+        prot_polys = self.region_store.protect_polygons.get(self._page_key, []) if self.region_store else []
 
         self.canvas.display(
             p, regs, prot,
@@ -1872,76 +2779,112 @@ FEATURES:
             excluded_passages=self.excluded_passages,
             preview=self.preview_var.get(),
             use_ocr=self.use_ocr.get(),
-            regex_patterns=self.regex_patterns
+            regex_patterns=self.regex_patterns,
+            cache_key=key
         )
 
-        self.page_label.config(text=f"{self.current_page + 1} / {len(self.doc)}")
+        self.page_label.config(text=f"{self.current_page + 1} / {self._page_count}")
         self.refresh_region_tree()
 
     # Drawing
     def start_draw(self, event):
+        # Zoom can't change mid-drag, so the page<->canvas factor is fixed per gesture
+        self._inv_scale = 1.0 / self.canvas.scale
         if self.current_tool in (ToolMode.DRAW_REDACT, ToolMode.DRAW_PROTECT):
-            self.start_x = self.canvas.canvasx(event.x) / self.canvas.scale
-            self.start_y = self.canvas.canvasy(event.y) / self.canvas.scale
+            # Keep the canvas-pixel start so update_draw doesn't rescale it per motion
+            cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+            self._start_px = (cx, cy)
+            self.start_x = cx * self._inv_scale
+            self.start_y = cy * self._inv_scale
             color = 'red' if self.drawing_mode == 'redact' else 'green'
-            self.temp_rect = self.canvas.create_rectangle(event.x, event.y, event.x, event.y, outline=color, width=2)
+            self.temp_rect = self.canvas.create_rectangle(cx, cy, cx, cy, outline=color, width=2)
         else:
             self.temp_poly_points = [self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)]
             color = 'red' if self.drawing_mode == 'redact' else 'green'
             self.temp_poly = self.canvas.create_line(*self.temp_poly_points, fill=color, width=2)
 
     def update_draw(self, event):
+        canvas = self.canvas
         if hasattr(self, 'temp_rect'):
-            self.canvas.coords(self.temp_rect,
-                               self.start_x * self.canvas.scale,
-                               self.start_y * self.canvas.scale,
-                               self.canvas.canvasx(event.x),
-                               self.canvas.canvasy(event.y))
+            canvas.coords(self.temp_rect, *self._start_px,
+                          canvas.canvasx(event.x), canvas.canvasy(event.y))
         elif hasattr(self, 'temp_poly'):
-            self.temp_poly_points.extend([self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)])
-            self.canvas.coords(self.temp_poly, *self.temp_poly_points)
+            self.temp_poly_points.extend([canvas.canvasx(event.x), canvas.canvasy(event.y)])
+            canvas.coords(self.temp_poly, *self.temp_poly_points)
 
     def end_draw(self, event):
         if hasattr(self, 'temp_rect'):
-            x2 = self.canvas.canvasx(event.x) / self.canvas.scale
-            y2 = self.canvas.canvasy(event.y) / self.canvas.scale
+            x2 = self.canvas.canvasx(event.x) * self._inv_scale
+            y2 = self.canvas.canvasy(event.y) * self._inv_scale
             rect = [min(self.start_x, x2), min(self.start_y, y2), max(self.start_x, x2), max(self.start_y, y2)]
             if self.region_store and (rect[2] - rect[0] > 5) and (rect[3] - rect[1] > 5):
                 self.region_store.add(self.current_page, rect, kind=self.drawing_mode)
             self.canvas.delete(self.temp_rect)
             del self.temp_rect
-            self.display_page()
+            self._schedule_redraw()
         elif hasattr(self, 'temp_poly'):
-            points = [p / self.canvas.scale for p in self.temp_poly_points]
+            inv = self._inv_scale
+            points = [p * inv for p in self.temp_poly_points]
             if self.region_store and len(points) >= 6:
                 self.region_store.add_polygon(self.current_page, points, kind=self.drawing_mode)
             self.canvas.delete(self.temp_poly)
             del self.temp_poly
             del self.temp_poly_points
-            self.display_page()
+            self._schedule_redraw()
 
     # Region interaction helpers
+    def _region_hit_index(self) -> list:
+        """Per-kind hit-test index for the current page, rebuilt only when regions change.
+
+        Each entry is ``(kind, y0s, boxes, tree, arr)`` with ``boxes`` sorted by
+        top edge. ``tree`` is an R-tree over the boxes when ``rtree`` is installed
+        and the page has at least REGION_RTREE_MIN_BOXES of that kind, else None.
+        Without a tree, ``arr`` holds the same boxes as an (N, 4) numpy array
+        when the page has at least REGION_NUMPY_MIN_BOXES of them, else None.
+        """
+        store = self.region_store
+        key = (store.revision, self._page_key)
+        if self._region_index_key != key or self._region_index_store is not store:
+            page_key = self._page_key
+            index = []
+            for kind, items, poly in (('redact', store.regions, False),
+                                      ('redact_poly', store.polygons, True),
+                                      ('protect', store.protect, False),
+                                      ('protect_poly', store.protect_polygons, True)):
+                boxes = sorted(((self.canvas._polygon_bbox(r) if poly else tuple(r), i)
+                                for i, r in enumerate(items.get(page_key, []))),
+                               key=lambda b: b[0][1])
+                tree = arr = None
+                if rtree_index is not None and len(boxes) >= self.REGION_RTREE_MIN_BOXES:
+                    tree = rtree_index.Index(
+                        (n, (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)), None)
+                        for n, ((x1, y1, x2, y2), _) in enumerate(boxes))
+                elif np is not None and len(boxes) >= self.REGION_NUMPY_MIN_BOXES:
+                    arr = np.asarray([b[0] for b in boxes], dtype=np.float64).reshape(-1, 4)
+                index.append((kind, [b[0][1] for b in boxes], boxes, tree, arr))
+            self._region_index_key, self._region_index = key, index
+            self._region_index_store = store
+        return self._region_index
+
     def find_region_at(self, x: float, y: float):
         """Return (kind, index) of region containing point or None."""
-        page_key = str(self.current_page)
-        regs = self.region_store.regions.get(page_key, []) if self.region_store else []
-        for i, (x1, y1, x2, y2) in enumerate(regs):
-            if x1 <= x <= x2 and y1 <= y <= y2:
-                return 'redact', i
-        poly_regs = self.region_store.polygons.get(page_key, []) if self.region_store else []
-        for i, pts in enumerate(poly_regs):
-            xs = pts[0::2]; ys = pts[1::2]
-            if min(xs) <= x <= max(xs) and min(ys) <= y <= max(ys):
-                return 'redact_poly', i
-        prot = self.region_store.protect.get(page_key, []) if self.region_store else []
-        for i, (x1, y1, x2, y2) in enumerate(prot):
-            if x1 <= x <= x2 and y1 <= y <= y2:
-                return 'protect', i
-        prot_polys = self.region_store.protect_polygons.get(page_key, []) if self.region_store else []
-        for i, pts in enumerate(prot_polys):
-            xs = pts[0::2]; ys = pts[1::2]
-            if min(xs) <= x <= max(xs) and min(ys) <= y <= max(ys):
-                return 'protect_poly', i
+        if not self.region_store:
+            return None
+        for kind, y0s, boxes, tree, arr in self._region_hit_index():
+            if tree is not None:
+                candidates = (boxes[n] for n in tree.intersection((x, y, x, y)))
+            elif arr is not None:
+                # One vectorized point-in-box test over the boxes starting at or above y
+                B = arr[:bisect.bisect_right(y0s, y)]
+                mask = (B[:, 0] <= x) & (x <= B[:, 2]) & (B[:, 1] <= y) & (y <= B[:, 3])
+                candidates = (boxes[n] for n in np.flatnonzero(mask))
+            else:
+                # Only boxes starting at or above y can contain the point
+                candidates = boxes[:bisect.bisect_right(y0s, y)]
+            hits = [i for (x1, y1, x2, y2), i in candidates
+                    if x1 <= x <= x2 and y1 <= y <= y2]
+            if hits:
+                return kind, min(hits)
         return None
 
     def delete_region(self, kind: str, index: int):
@@ -1952,12 +2895,12 @@ FEATURES:
             self.region_store.remove_polygon(self.current_page, index, kind=base)
         else:
             self.region_store.remove(self.current_page, index, kind=kind)
-        self.display_page()
+        self._schedule_redraw()
 
     def toggle_region_kind(self, kind: str, index: int):
         if not self.region_store:
             return
-        page_key = str(self.current_page)
+        page_key = self._page_key
         if kind in ('redact', 'protect'):
             if kind == 'redact':
                 rect = self.region_store.regions[page_key][index]
@@ -1973,7 +2916,7 @@ FEATURES:
             pts = polys[index]
             self.region_store.remove_polygon(self.current_page, index, base)
             self.region_store.add_polygon(self.current_page, pts, kind='protect' if base=='redact' else 'redact')
-        self.display_page()
+        self._schedule_redraw()
 
     def on_canvas_right_click(self, event):
         if not self.region_store:
@@ -1991,19 +2934,26 @@ FEATURES:
 
     # ------------------------- Save ----------------------------
     def save_patterns(self):
-        kws = list(self.keywords_lb.get(0, tk.END))
-        passages = [p.strip() for p in self.passages_txt.get(1.0, tk.END).split('\n---\n') if p.strip()]
-        self.patterns = {'keywords': kws, 'passages': passages}
+        self.update_patterns_from_ui()
         self.save_app_configs()
         self.schedule_preview_update()
 
     def save_exclusions(self):
-        self.exclusions = list(self.excl_lb.get(0, tk.END))
-        passages = [p.strip() for p in self.excluded_passages_txt.get(1.0, tk.END).split('\n---\n') if p.strip()]
-        self.excluded_passages = passages
+        self.update_exclusions_from_ui()
+        self._casefolded_exclusions()
         self.save_app_configs()
         self.schedule_preview_update()
 
+    def _casefolded_exclusions(self) -> list[str]:
+        """Exclusions plus excluded passages, casefolded; recomputed only when they change"""
+        # Compared by contents; equal hashes alone don't mean equal lists
+        src = (tuple(self.exclusions), tuple(self.excluded_passages))
+        if src != self._excl_cf_src:
+            self._excl_cf = list(dict.fromkeys(
+                e.casefold() for e in chain(self.exclusions, self.excluded_passages)))
+            self._excl_cf_src = src
+        return self._excl_cf
+
     def save_excluded_passages(self):
         """Backwards compatibility wrapper"""
         self.save_exclusions()
@@ -2023,49 +2973,438 @@ FEATURES:
         if not output:
             return
 
-        # Show progress dialog for OCR processing
-        if self.use_ocr.get() and OCR_AVAILABLE:
-            progress = tk.Toplevel(self.root)
-            progress.title("Processing...")
-            progress.geometry("300x100")
-            ttk.Label(progress, text="Applying redactions with OCR...").pack(pady=20)
-            progress_bar = ttk.Progressbar(progress, mode='indeterminate')
-            progress_bar.pack(padx=20, fill=tk.X)
-            progress_bar.start()
-            self.root.update()
+        # Modal progress dialog; the bar animates from the Tk loop, and the
+        # dialog can't be closed until the worker has written the file
+        use_ocr = self.use_ocr.get() and OCR_AVAILABLE
+        progress = tk.Toplevel(self.root)
+        progress.title("Processing...")
+        progress.geometry("300x100")
+        progress.transient(self.root)
+        progress.protocol('WM_DELETE_WINDOW', lambda: None)
+        progress.grab_set()
+        ttk.Label(progress, text="Applying redactions with OCR..." if use_ocr
+                  else "Applying redactions...").pack(pady=20)
+        progress_bar = ttk.Progressbar(progress, mode='determinate', maximum=max(1, len(self.doc)))
+        progress_bar.pack(padx=20, fill=tk.X)
+
+        # Snapshot everything on the Tk thread; the worker never touches widgets
+        self._sync_from_ui()
+        store = self.region_store
+        args = (
+            self.doc.name, output,
+            {k: list(v) for k, v in store.regions.items()},
+            {k: list(v) for k, v in store.protect.items()},
+            {k: list(v) for k, v in store.polygons.items()},
+            {k: list(v) for k, v in store.protect_polygons.items()},
+            {k: list(v) if isinstance(v, list) else v for k, v in self.patterns.items()},
+            # Combined exclusions and excluded passages, casefolded once
+            list(self._casefolded_exclusions()),
+            list(self.regex_patterns),
+            self.use_ocr.get(),
+        )
+        kwargs = dict(
+            scrub_meta=self.scrub_meta_var.get(),
+            garbage=4 if self.optimize_var.get() else 1,
+            convert_images=self.convert_img_var.get(),
+        )
+        done = queue.Queue()
+        # Pages finished so far; written by the worker, read by the Tk poll
+        pages_done = [0]
+
+        def work():
+            try:
+                apply_redactions(*args, **kwargs,
+                                 progress_cb=lambda i, n: pages_done.__setitem__(0, i))
+                done.put(None)
+            except Exception as e:
+                done.put(e)
 
-        # Combine exclusions and excluded passages
-        all_exclusions = self.exclusions + self.excluded_passages
+        # Not a daemon: interpreter exit waits for the output file to be complete
+        self._save_thread = threading.Thread(target=work)
+        self._save_thread.start()
+        self.root.after(50, lambda: self._check_redact_done(done, progress, output,
+                                                            progress_bar, pages_done))
 
+    def _check_redact_done(self, done: queue.Queue, progress: tk.Toplevel, output: str,
+                           progress_bar=None, pages_done=None):
+        """Poll the background redaction; update the bar, close the dialog and report once it finishes"""
         try:
-            apply_redactions(
-                self.doc.name, output,
-                self.region_store.regions,
-                self.region_store.protect,
-                self.region_store.polygons,
-                self.region_store.protect_polygons,
-                self.patterns,
-                all_exclusions,
-                self.regex_patterns,
-                self.use_ocr.get(),
-                scrub_meta=self.scrub_meta_var.get(),
-                convert_images=self.convert_img_var.get()
-            )
+            error = done.get_nowait()
+        except queue.Empty:
+            if progress_bar is not None:
+                progress_bar['value'] = pages_done[0]
+            self.root.after(50, lambda: self._check_redact_done(done, progress, output,
+                                                                progress_bar, pages_done))
+            return
+        self._save_thread.join()
+        self._save_thread = None
+        progress.destroy()
+        # Catch up on any redraw deferred while the save was running
+        self.display_page()
+        if error is None:
             messagebox.showinfo('Done', f'Saved to {output}', parent=self.root)
-        finally:
-            if self.use_ocr.get() and OCR_AVAILABLE:
-                progress.destroy()
+        else:
+            messagebox.showerror('Error', f'Failed to save redacted file:\n{error}', parent=self.root)
+
+    def on_close(self):
+        """Persist state and quit; refused while Save Redacted is still writing"""
+        if self._save_thread is not None:
+            messagebox.showwarning('Saving', 'Wait for the redacted file to finish saving.',
+                                   parent=self.root)
+            return
+        self.save_prefs()
+        self._flush_autosave()
+        self.canvas.ocr_processor.close()
+        self.root.destroy()
 
 
 # ---------------------------------------------------------------------------
 # Core redaction logic (enhanced with OCR and regex)
 # ---------------------------------------------------------------------------
+# Above this many patterns, prescreen pages with a single Aho-Corasick pass
+AHOCORASICK_MIN_PATTERNS = 50
+
+# page.search_for's default flags; a TextPage shared between searches must
+# be built with these so the hits are the same as separate search_for calls
+SEARCH_TEXTPAGE_FLAGS = (fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_WHITESPACE |
+                         fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP)
+
+
+def _search_key(text: str) -> str:
+    """Normalize text the way MuPDF search compares it (case, whitespace runs)"""
+    return ' '.join(text.lower().split())
+
+
+class ProtectIndex:
+    """Containment lookups over one page's protected rectangles.
+
+    Uses an R-tree when ``rtree`` is installed and the page has at least
+    RTREE_MIN_RECTS rectangles; building and querying one costs tens of
+    microseconds, far more than scanning a few rectangles. Otherwise the
+    rectangles are kept sorted by top edge and only those starting at or
+    above a match are tested, as one vectorized comparison when numpy is
+    available and the page has enough rectangles to pay for it.
+    """
+
+    RTREE_MIN_RECTS: int = 64
+    NUMPY_MIN_RECTS: int = 16
+    # Largest hits x rects comparison contains_many does as one broadcast
+    NUMPY_MAX_PAIRS: int = 1 << 16
+
+    def __init__(self, rects):
+        self.rects = sorted((tuple(r) for r in rects), key=lambda r: r[1])
+        self._y0s = [r[1] for r in self.rects]
+        self._tree = None
+        self._arr = None
+        self._all = None  # every rect as one array, built by contains_many
+        if rtree_index is not None and len(self.rects) >= self.RTREE_MIN_RECTS:
+            self._tree = rtree_index.Index()
+            for i, (x1, y1, x2, y2) in enumerate(self.rects):
+                self._tree.insert(i, (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)))
+        elif np is not None and len(self.rects) >= self.NUMPY_MIN_RECTS:
+            self._arr = np.asarray(self.rects, dtype=np.float64).reshape(-1, 4)
+
+    def contains(self, area) -> bool:
+        """True if any protected rectangle fully contains ``area``"""
+        if not self.rects:
+            return False
+        if self._tree is not None:
+            candidates = (self.rects[i] for i in
+                          self._tree.intersection((area.x0, area.y0, area.x1, area.y1)))
+        else:
+            hi = bisect.bisect_right(self._y0s, area.y0)
+            if self._arr is not None:
+                P = self._arr[:hi]
+                return bool(np.any((P[:, 0] <= area.x0) & (P[:, 1] <= area.y0) &
+                                   (P[:, 2] >= area.x1) & (P[:, 3] >= area.y1)))
+            candidates = self.rects[:hi]
+        return any(px1 <= area.x0 and py1 <= area.y0 and px2 >= area.x1 and py2 >= area.y1
+                   for px1, py1, px2, py2 in candidates)
+
+    def contains_many(self, areas: list) -> list:
+        """``contains`` for each of ``areas``; one broadcast comparison when numpy is available"""
+        if not self.rects or not areas:
+            return [False] * len(areas)
+        if np is None or len(areas) * len(self.rects) > self.NUMPY_MAX_PAIRS:
+            return [self.contains(area) for area in areas]
+        if self._all is None:
+            self._all = np.asarray(self.rects, dtype=np.float64).reshape(-1, 4)
+        P = self._all[None, :, :]
+        H = np.array([(a.x0, a.y0, a.x1, a.y1) for a in areas], dtype=np.float64)[:, None, :]
+        inside = ((P[..., 0] <= H[..., 0]) & (P[..., 1] <= H[..., 1]) &
+                  (P[..., 2] >= H[..., 2]) & (P[..., 3] >= H[..., 3])).any(axis=1)
+        return inside.tolist()
+
+
+def _context_text(textpage, area, pad: float = 20) -> str:
+    """Casefolded text of ``area`` widened by ``pad`` horizontally.
+
+    ``textpage`` is the page's default ``get_textpage()``, extracted once and
+    reused for every hit; extractTextbox on it is what ``page.get_textbox``
+    does, so the context is character-exact, not whole overlapping words.
+    """
+    return textpage.extractTextbox(
+        fitz.Rect(area.x0 - pad, area.y0, area.x1 + pad, area.y1)).casefold()
+
+
+def _build_prescreen(search_patterns: list) -> tuple:
+    """Return ``(search_keys, automaton, always_search)`` for _prescreen.
+
+    Only patterns whose normalized text occurs on the page are handed to
+    search_for. Empty keys can't be prescreened and always pass.
+    """
+    search_keys = [_search_key(pattern) for pattern in search_patterns]
+    automaton = None
+    if ahocorasick is not None and len(search_patterns) > AHOCORASICK_MIN_PATTERNS:
+        automaton = ahocorasick.Automaton()
+        for i, key in enumerate(search_keys):
+            if key:
+                if key in automaton:
+                    automaton.get(key).append(i)
+                else:
+                    automaton.add_word(key, [i])
+        automaton.make_automaton()
+    return search_keys, automaton, {i for i, key in enumerate(search_keys) if not key}
+
+
+def _prescreen(page, search_patterns: list, search_keys: list, automaton, always_search: set) -> list:
+    """The subset of ``search_patterns`` whose text occurs somewhere on ``page``"""
+    if not search_patterns:
+        return []
+    page_key = _search_key(page.get_text(flags=fitz.TEXTFLAGS_SEARCH))
+    if automaton is not None:
+        found = set(always_search)
+        for _, idxs in automaton.iter(page_key):
+            found.update(idxs)
+        return [search_patterns[i] for i in sorted(found)]
+    return [pattern for pattern, key in zip(search_patterns, search_keys) if key in page_key]
+
+
+def _build_exclusion_automaton(folded_exclusions: list):
+    """Aho-Corasick automaton over the exclusions for large lists, else None.
+
+    Empty exclusions match everything and can't be added to an automaton, so
+    their presence keeps the plain substring scan.
+    """
+    if (ahocorasick is None or len(folded_exclusions) <= AHOCORASICK_MIN_PATTERNS
+            or not all(folded_exclusions)):
+        return None
+    automaton = ahocorasick.Automaton()
+    for excl in folded_exclusions:
+        automaton.add_word(excl, excl)
+    automaton.make_automaton()
+    return automaton
+
+
+# Recent automaton builds keyed by their input list; repeated saves with an
+# unchanged configuration reuse them instead of rebuilding. Saves run on a
+# worker thread while the preview runs on the Tk thread, hence the lock.
+_BUILD_CACHE: OrderedDict = OrderedDict()
+_BUILD_CACHE_SIZE = 8
+_BUILD_CACHE_LOCK = threading.Lock()
+
+
+def _cached_build(build, items: list):
+    """``build(items)``, memoized on the function and the list's contents"""
+    key = (build.__name__, tuple(items))
+    with _BUILD_CACHE_LOCK:
+        hit = _BUILD_CACHE.get(key)
+        if hit is not None:
+            _BUILD_CACHE.move_to_end(key)
+            return hit
+    hit = build(items)
+    with _BUILD_CACHE_LOCK:
+        _BUILD_CACHE[key] = hit
+        if len(_BUILD_CACHE) > _BUILD_CACHE_SIZE:
+            _BUILD_CACHE.popitem(last=False)
+    return hit
+
+
+def _has_exclusion(text: str, folded_exclusions: list, automaton) -> bool:
+    """True if any exclusion occurs in the casefolded ``text``"""
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return any(e in text for e in folded_exclusions)
+
+
+def _build_scan_bundle(patterns: dict, exclusions: list, regex_patterns: list,
+                       protect_regions: dict, protect_polygons: dict) -> dict:
+    """Precompute everything the per-page scan needs; picklable for scan_page workers"""
+    all_patterns = patterns.get('keywords', []) + patterns.get('passages', [])
+
+    # Casefold/compile everything once per call instead of per page and match
+    # Exclusions are substring tests, so each duplicate (keyword lists and
+    # passages often overlap) would be one more scan of every context
+    folded_exclusions = list(dict.fromkeys(excl.casefold() for excl in exclusions))
+    folded_patterns = [pattern.casefold() for pattern in all_patterns]
+    search_patterns = [pattern for pattern, pf in zip(all_patterns, folded_patterns)
+                       if not any(e in pf for e in folded_exclusions)]
+    compiled_regex = []
+    for pattern in regex_patterns or []:
+        try:
+            compiled_regex.append(re.compile(pattern, re.IGNORECASE))
+        except re.error:
+            continue
+
+    search_keys, automaton, always_search = _cached_build(_build_prescreen, search_patterns)
+
+    return {
+        'folded_exclusions': folded_exclusions,
+        'exclusion_automaton': _cached_build(_build_exclusion_automaton, folded_exclusions),
+        'folded_patterns': folded_patterns,
+        'search_patterns': search_patterns,
+        'search_keys': search_keys,
+        'automaton': automaton,
+        'always_search': always_search,
+        'compiled_regex': compiled_regex,
+        'protect_regions': protect_regions,
+        'protect_polygons': protect_polygons,
+    }
+
+
+def _unseen(areas: list, seen: set) -> list:
+    """The ``areas`` not already in ``seen`` (by rounded corners), adding them to it"""
+    fresh = []
+    for area in areas:
+        key = (round(area.x0, 1), round(area.y0, 1), round(area.x1, 1), round(area.y1, 1))
+        if key not in seen:
+            seen.add(key)
+            fresh.append(area)
+    return fresh
+
+
+def _scan_page(page, page_num: int, bundle: dict, ocr_processor=None) -> list:
+    """Return the rects to redact on one page (text, OCR and regex matches)"""
+    folded_exclusions = bundle['folded_exclusions']
+    exclusion_automaton = bundle['exclusion_automaton']
+    folded_patterns = bundle['folded_patterns']
+    compiled_regex = bundle['compiled_regex']
+    page_hits = []
+
+    # Get protected regions for this page
+    protected = ProtectIndex(bundle['protect_regions'].get(str(page_num), []) + [
+        (min(p[0::2]), min(p[1::2]), max(p[0::2]), max(p[1::2]))
+        for p in bundle['protect_polygons'].get(str(page_num), [])
+    ])
+
+    # Regular text pattern search
+    page_patterns = _prescreen(page, bundle['search_patterns'], bundle['search_keys'],
+                               bundle['automaton'], bundle['always_search'])
+    # TextPage for exclusion-context checks, built on the first match
+    context_page = None
+    # One TextPage for every search on this page, built on the first search;
+    # search_for would otherwise extract the page again for each pattern
+    textpage = None
+    # Rects already checked on this page; overlapping patterns/regexes often
+    # hit the same span and the protect/context verdict would be identical
+    seen = set()
+    for pattern in page_patterns:
+        if textpage is None:
+            textpage = page.get_textpage(flags=SEARCH_TEXTPAGE_FLAGS)
+        areas = _unseen(page.search_for(pattern, quads=False, textpage=textpage), seen)
+        # Check if each area is in a protected region, all hits in one test
+        for area, inside in zip(areas, protected.contains_many(areas)):
+            if not inside:
+                # Check context for exclusions
+                should_redact = True
+                if folded_exclusions:
+                    if context_page is None:
+                        context_page = page.get_textpage()
+                    context = _context_text(context_page, area)
+                    if _has_exclusion(context, folded_exclusions, exclusion_automaton):
+                        should_redact = False
+
+                if should_redact:
+                    page_hits.append(area)
+
+    # OCR-based search if enabled
+    if ocr_processor and ocr_processor.ocr_available:
+        ocr_results = ocr_processor.extract_text_with_positions(page)
+        for text, rect in ocr_results:
+            text_folded = text.casefold()
+            for pf in folded_patterns:
+                if pf in text_folded:
+                    # Check protections and exclusions
+                    if not protected.contains(rect):
+                        # Check context
+                        should_redact = True
+                        if _has_exclusion(text_folded, folded_exclusions, exclusion_automaton):
+                            should_redact = False
+
+                        if should_redact:
+                            page_hits.append(rect)
+
+    # Regex pattern search
+    if compiled_regex:
+        page_text = page.get_text()
+        # Each distinct matched string is located once, however many times and
+        # by however many regexes it matched; a search for it finds every
+        # occurrence. Strings already searched as patterns would only yield
+        # rects in ``seen``.
+        searched = set(page_patterns)
+        matched_texts = [text for text in dict.fromkeys(
+            match.group(0) for cre in compiled_regex for match in cre.finditer(page_text))
+            if text not in searched]
+        for matched_text in matched_texts:
+            # Find location on page
+            if textpage is None:
+                textpage = page.get_textpage(flags=SEARCH_TEXTPAGE_FLAGS)
+            areas = _unseen(page.search_for(matched_text, quads=False, textpage=textpage), seen)
+            # Check protections
+            for area, inside in zip(areas, protected.contains_many(areas)):
+                if not inside:
+                    # Check exclusions
+                    should_redact = True
+                    if folded_exclusions:
+                        if context_page is None:
+                            context_page = page.get_textpage()
+                        context = _context_text(context_page, area)
+                        if _has_exclusion(context, folded_exclusions, exclusion_automaton):
+                            should_redact = False
+
+                    if should_redact:
+                        page_hits.append(area)
+
+    return page_hits
+
+
+# Per-process state for scan_page workers: open documents
+_SCAN_WORKER_STATE: dict = {}
+
+# Documents shorter than this are scanned in-process; pool startup would dominate
+PARALLEL_SCAN_MIN_PAGES = 16
+
+
+def scan_page(input_pdf: str, page_num: int, bundle: dict, use_ocr: bool = False) -> list[tuple]:
+    """Scan one page of ``input_pdf`` in a worker process, returning rect tuples.
+
+    MuPDF documents can't be pickled, so each worker opens the file itself
+    (once, cached for the rest of its pages).
+    """
+    docs = _SCAN_WORKER_STATE.setdefault('docs', {})
+    doc = docs.get(input_pdf)
+    if doc is None:
+        doc = docs[input_pdf] = fitz.open(input_pdf)
+    ocr_processor = get_ocr_processor() if use_ocr else None
+    return [tuple(r) for r in _scan_page(doc[page_num], page_num, bundle, ocr_processor)]
+
+
 def apply_redactions(input_pdf: str, output_pdf: str, regions: dict[str, list],
                      protect_regions: dict[str, list], polygons: dict[str, list],
                      protect_polygons: dict[str, list], patterns: dict,
                      exclusions: list, regex_patterns: list = None,
                      use_ocr: bool = False, scrub_meta: bool = False,
-                     convert_images: bool = False):
+                     convert_images: bool = False, garbage: int = 1,
+                     progress_cb=None):
+    """Redact ``input_pdf`` into ``output_pdf``.
+
+    ``garbage`` is passed to ``Document.save``: the default 1 only drops
+    unused objects, 4 also deduplicates streams for the smallest output
+    at a much higher cost on large documents.
+
+    ``progress_cb(done, total)`` is called after each page is redacted,
+    from the calling thread.
+    """
     ext = Path(input_pdf).suffix.lower()
     img_exts = ['.jpg', '.jpeg', '.png', '.gif', '.tif', '.tiff', '.bmp']
     if ext in img_exts and not convert_images:
@@ -2082,122 +3421,75 @@ def apply_redactions(input_pdf: str, output_pdf: str, regions: dict[str, list],
             doc.set_metadata({})
         except Exception:
             pass
-    ocr_processor = OCRProcessor() if use_ocr else None
+    # Manual regions first; pattern hits are added per page below
+    hits: dict[int, list] = {}
 
     # region redactions - rectangles
     for page_num, regs in regions.items():
-        page = doc[int(page_num)]
+        page_hits = hits.setdefault(int(page_num), [])
         for x1, y1, x2, y2 in regs:
-            page.add_redact_annot(fitz.Rect(x1, y1, x2, y2), fill=(0, 0, 0))
+            page_hits.append(fitz.Rect(x1, y1, x2, y2))
     # polygon redactions (approx by bounding box)
     for page_num, polys in polygons.items():
-        page = doc[int(page_num)]
+        page_hits = hits.setdefault(int(page_num), [])
         for pts in polys:
             xs = pts[0::2]
             ys = pts[1::2]
-            rect = fitz.Rect(min(xs), min(ys), max(xs), max(ys))
-            page.add_redact_annot(rect, fill=(0, 0, 0))
-
-    # text patterns
-    all_patterns = patterns.get('keywords', []).copy()
-    all_patterns += patterns.get('passages', [])
-
-    for page_num, page in enumerate(doc):
-        # Get protected regions for this page
-        protected = protect_regions.get(str(page_num), []) + [
-            (min(p[0::2]), min(p[1::2]), max(p[0::2]), max(p[1::2]))
-            for p in protect_polygons.get(str(page_num), [])
-        ]
-
-        # Regular text pattern search
-        for pattern in all_patterns:
-            if any(excl.lower() in pattern.lower() for excl in exclusions):
-                continue
-
-            for area in page.search_for(pattern, quads=False):
-                # Check if area is in a protected region
-                is_protected = False
-                for px1, py1, px2, py2 in protected:
-                    prot_rect = fitz.Rect(px1, py1, px2, py2)
-                    if prot_rect.contains(area):
-                        is_protected = True
-                        break
-
-                if not is_protected:
-                    # Check context for exclusions
-                    should_redact = True
-                    expanded = fitz.Rect(area)
-                    expanded.x0 -= 20
-                    expanded.x1 += 20
-                    try:
-                        context = page.get_textbox(expanded)
-                        if any(excl.lower() in context.lower() for excl in exclusions):
-                            should_redact = False
-                    except:
-                        pass
-
-                    if should_redact:
-                        page.add_redact_annot(area, fill=(0, 0, 0))
-
-        # OCR-based search if enabled
-        if use_ocr and ocr_processor and ocr_processor.ocr_available:
-            ocr_results = ocr_processor.extract_text_with_positions(page)
-            for text, rect in ocr_results:
-                for pattern in all_patterns:
-                    if pattern.lower() in text.lower():
-                        # Check protections and exclusions
-                        is_protected = any(
-                            rect.x0 >= px1 and rect.y0 >= py1 and
-                            rect.x1 <= px2 and rect.y1 <= py2
-                            for px1, py1, px2, py2 in protected
-                        )
-
-                        if not is_protected:
-                            # Check context
-                            should_redact = True
-                            if any(excl.lower() in text.lower() for excl in exclusions):
-                                should_redact = False
-
-                            if should_redact:
-                                page.add_redact_annot(rect, fill=(0, 0, 0))
-
-        # Regex pattern search
-        if regex_patterns:
-            page_text = page.get_text()
-            for pattern in regex_patterns:
+            page_hits.append(fitz.Rect(min(xs), min(ys), max(xs), max(ys)))
+
+    bundle = _build_scan_bundle(patterns, exclusions, regex_patterns,
+                                protect_regions, protect_polygons)
+
+    # Pages are independent, so long documents are scanned across processes.
+    # Results arrive in page order and are annotated/applied here as they come
+    # in, overlapping this process's apply work with the workers' scanning.
+    page_count = doc.page_count
+    workers = min(os.cpu_count() or 1, page_count)
+    pool = None
+    if workers > 1 and page_count >= PARALLEL_SCAN_MIN_PAGES:
+        try:
+            # Spawn, never fork: the GUI saves from a worker thread while the Tk,
+            # render and IO threads run, and a forked child would inherit any
+            # lock one of them held (e.g. the OCR lock) already locked
+            pool = ProcessPoolExecutor(max_workers=workers,
+                                       mp_context=multiprocessing.get_context('spawn'))
+            results = pool.map(scan_page, repeat(input_path), range(page_count),
+                               repeat(bundle), repeat(use_ocr),
+                               chunksize=max(1, page_count // (workers * 4)))
+        except OSError:
+            pool = None  # no usable pool here; scan in-process instead
+    ocr_processor = get_ocr_processor() if use_ocr else None
+
+    # Single pass over the pages: scan (unless a pool already did), then
+    # annotate and apply while the page and its text are still loaded
+    try:
+        for page_num, page in enumerate(doc):
+            found = None
+            if pool is not None:
                 try:
-                    for match in re.finditer(pattern, page_text, re.IGNORECASE):
-                        matched_text = match.group(0)
-                        # Find location on page
-                        for area in page.search_for(matched_text, quads=False):
-                            # Check protections
-                            is_protected = any(
-                                area.x0 >= px1 and area.y0 >= py1 and
-                                area.x1 <= px2 and area.y1 <= py2
-                                for px1, py1, px2, py2 in protected
-                            )
-
-                            if not is_protected:
-                                # Check exclusions
-                                should_redact = True
-                                expanded = fitz.Rect(area)
-                                expanded.x0 -= 20
-                                expanded.x1 += 20
-                                try:
-                                    context = page.get_textbox(expanded)
-                                    if any(excl.lower() in context.lower() for excl in exclusions):
-                                        should_redact = False
-                                except:
-                                    pass
-
-                                if should_redact:
-                                    page.add_redact_annot(area, fill=(0, 0, 0))
-                except re.error:
-                    continue
-
-    for page in doc:
-        page.apply_redactions()
-    doc.save(output_pdf, garbage=4)
+                    found = [fitz.Rect(r) for r in next(results)]
+                except (OSError, BrokenProcessPool):
+                    # Pool died; scan the remaining pages in-process
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = None
+            if found is None:
+                found = _scan_page(page, page_num, bundle, ocr_processor)
+            rects = hits.get(page_num, []) + found
+            if rects:
+                # Skip duplicate rects produced by overlapping patterns
+                seen = set()
+                for rect in rects:
+                    key = (round(rect.x0, 2), round(rect.y0, 2), round(rect.x1, 2), round(rect.y1, 2))
+                    if key not in seen:
+                        seen.add(key)
+                        page.add_redact_annot(rect, fill=(0, 0, 0))
+                page.apply_redactions()
+            if progress_cb is not None:
+                progress_cb(page_num + 1, page_count)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    doc.save(output_pdf, garbage=garbage, deflate=True)
     doc.close()
 
 
@@ -2205,12 +3497,24 @@ def apply_redactions(input_pdf: str, output_pdf: str, regions: dict[str, list],
 # CLI interface / entrypoint
 # ---------------------------------------------------------------------------
 def run_gui():
+    if not OCR_AVAILABLE:
+        print(OCR_MISSING_MSG)
+    _gui_imports()
     root = tk.Tk()
     app = PDFRedactorGUI(root)
-    root.protocol('WM_DELETE_WINDOW', lambda: (app.save_prefs(), root.destroy()))
+    root.protocol('WM_DELETE_WINDOW', app.on_close)
     root.mainloop()
 
 
+def _load_or_default(path_arg: str | None, purpose: str, default):
+    """JSON from ``path_arg`` if given, else the latest app-wide ``purpose`` file, else ``default``"""
+    if path_arg:
+        # An explicit path that can't be read is an error, not a cue to fall back
+        return _read_json_fd(path_arg)
+    latest = JSONStore.find_latest_file('app_wide', purpose)
+    return _read_json(latest) if latest else default
+
+
 def main():
     parser = argparse.ArgumentParser(description='Enhanced PDF redactor with OCR support')
     parser.add_argument('--gui', action='store_true', help='Launch GUI')
@@ -2222,6 +3526,8 @@ def main():
     parser.add_argument('--preset', help='Apply a named preset')
     parser.add_argument('--ocr', action='store_true', help='Use OCR for scanned PDFs')
     parser.add_argument('--scrub-metadata', action='store_true', help='Remove metadata from output')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Full garbage collection on save (smaller output, slower on large PDFs)')
     parser.add_argument('--convert-images', action='store_true',
                         help='Convert image files to PDF before processing')
     parser.add_argument('--apply', action='store_true', help='Apply redactions')
@@ -2237,6 +3543,27 @@ def main():
 
     # CLI mode - apply redactions
     if args.apply or (args.input and args.output):
+        def load_exclusions():
+            data = _load_or_default(args.exclusions, 'exclusions', None)
+            if isinstance(data, list):
+                return data, []
+            if isinstance(data, dict):
+                return data.get('keywords', []), data.get('passages', [])
+            return [], []
+
+        def load_regions():
+            if args.regions:
+                data = _read_json_fd(args.regions)
+                return (data.get('regions', {}), data.get('protect', {}),
+                        data.get('polygons', {}), data.get('protect_polygons', {}))
+            store = RegionStore.load(Path(args.input).stem)
+            return store.regions, store.protect, store.polygons, store.protect_polygons
+
+        # The three loads are independent; overlap their reads on the IO pool
+        # while the patterns (or preset) load here
+        exclusions_future = _IO_POOL.submit(load_exclusions)
+        regions_future = _IO_POOL.submit(load_regions)
+
         # Load preset if specified
         regex_patterns = []
         if args.preset:
@@ -2251,65 +3578,26 @@ def main():
                 patterns = {'keywords': [], 'passages': []}
         else:
             # Load patterns
-            patterns = {'keywords': [], 'passages': []}
-            if args.patterns:
-                with open(args.patterns) as f:
-                    patterns = json.load(f)
-            else:
-                pat = JSONStore.find_latest_file('app_wide', 'patterns')
-                if pat:
-                    patterns = json.loads(pat.read_text())
-
-        # Load exclusions
-        exclusions = []
-        excluded_passages = []
-        if args.exclusions:
-            with open(args.exclusions) as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    exclusions = data
-                elif isinstance(data, dict):
-                    exclusions = data.get('keywords', [])
-                    excluded_passages = data.get('passages', [])
-        else:
-            exc = JSONStore.find_latest_file('app_wide', 'exclusions')
-            if exc:
-                data = json.loads(exc.read_text())
-                if isinstance(data, list):
-                    exclusions = data
-                elif isinstance(data, dict):
-                    exclusions = data.get('keywords', [])
-                    excluded_passages = data.get('passages', [])
-
-        # Combine all exclusions
-        all_exclusions = exclusions + excluded_passages
-
-        # Load regions
-        regions = {}
-        protect_regions = {}
-        polygons = {}
-        protect_polygons = {}
-        if args.regions:
-            with open(args.regions) as f:
-                data = json.load(f)
-                regions = data.get('regions', {})
-                protect_regions = data.get('protect', {})
-                polygons = data.get('polygons', {})
-                protect_polygons = data.get('protect_polygons', {})
-        else:
-            store = RegionStore.load(Path(args.input).stem)
-            regions = store.regions
-            protect_regions = store.protect
-            polygons = store.polygons
-            protect_polygons = store.protect_polygons
+            patterns = _load_or_default(args.patterns, 'patterns', {'keywords': [], 'passages': []})
+
+        if args.ocr and not OCR_AVAILABLE:
+            print(OCR_MISSING_MSG)
+
+        exclusions, excluded_passages = exclusions_future.result()
+        # Combine all exclusions; both lists were just loaded, so extend in place
+        all_exclusions = exclusions
+        all_exclusions.extend(excluded_passages)
+        regions, protect_regions, polygons, protect_polygons = regions_future.result()
 
         apply_redactions(args.input, args.output, regions, protect_regions,
                          polygons, protect_polygons,
                          patterns, all_exclusions, regex_patterns,
                          args.ocr, scrub_meta=args.scrub_metadata,
-                         convert_images=args.convert_images)
+                         convert_images=args.convert_images,
+                         garbage=4 if args.optimize else 1)
         print(f'Saved to {args.output}')
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     main()
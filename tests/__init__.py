@@ -0,0 +1,12 @@
+import importlib.util
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / 'redact-x_unified.py'
+
+
+def load_module():
+    """Load the redactor script (its file name isn't importable) as a module"""
+    spec = importlib.util.spec_from_file_location('redact_x_unified', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
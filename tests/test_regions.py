@@ -0,0 +1,78 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from tests import load_module
+
+rx = load_module()
+
+
+def state(store):
+    return store.regions, store.protect, store.polygons, store.protect_polygons
+
+
+class RegionJournalTest(unittest.TestCase):
+    STEM = 'journal_test'
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        data_dir = rx.JSONStore.DATA_DIR
+        rx.JSONStore.DATA_DIR = Path(tmp.name)
+        self.addCleanup(setattr, rx.JSONStore, 'DATA_DIR', data_dir)
+        self.store = rx.RegionStore(self.STEM)
+        self.addCleanup(self.close_journal)
+
+    def close_journal(self):
+        if self.store._journal is not None:
+            self.store._journal.close()
+
+    def edit(self):
+        store = self.store
+        store.add(0, [1, 2, 3, 4])
+        store.add(0, [5, 6, 7, 8])
+        store.add(1, [9, 9, 10, 10], kind='protect')
+        store.add_polygon(2, [0, 0, 1, 0, 1, 1])
+        store.add_polygon(2, [5, 5, 6, 5, 6, 6], kind='protect')
+        store.update(0, 1, [50, 60, 70, 80])
+        store.update_polygon(2, 0, [0, 0, 2, 0, 2, 2])
+        store.remove(1, 0, kind='protect')
+        store.add(3, [1, 1, 2, 2])
+        store.remove(3, 0)
+        store.remove_polygon(2, 0, kind='protect')
+
+    def test_journal_replay(self):
+        self.edit()
+        self.assertGreater(self.store._journal_ops, 0)
+        self.assertEqual(state(rx.RegionStore.load(self.STEM)), state(self.store))
+
+    def test_undo_then_flush(self):
+        self.edit()
+        self.store.undo()
+        self.store.undo()
+        self.store.flush_autosave()
+        self.assertEqual(state(rx.RegionStore.load(self.STEM)), state(self.store))
+        # Edits after the snapshot go back to the journal
+        self.store.add(4, [3, 3, 4, 4])
+        self.assertEqual(self.store._journal_ops, 1)
+        self.assertEqual(state(rx.RegionStore.load(self.STEM)), state(self.store))
+
+    def test_torn_final_line(self):
+        self.edit()
+        with open(self.store._journal_path(), 'ab') as f:
+            f.write(b'{"op":"add","pa')
+        self.assertEqual(state(rx.RegionStore.load(self.STEM)), state(self.store))
+
+
+    def test_stale_journal_not_replayed(self):
+        self.edit()
+        journal = self.store._journal_path()
+        stale = journal.read_bytes()
+        # Crash after the new snapshot replaced the old one but before the
+        # journal was truncated: the old journal is still on disk
+        self.store.autosave(force=True)
+        journal.write_bytes(stale)
+        self.assertEqual(state(rx.RegionStore.load(self.STEM)), state(self.store))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import importlib
+from pathlib import Path
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import fitz
+
+from tests import SCRIPT, load_module
+
+rx = load_module()
+
+
+def make_page(doc, lines):
+    page = doc.new_page()
+    for i, line in enumerate(lines):
+        page.insert_text((50, 60 + 24 * i), line, fontsize=11)
+    return page
+
+
+class ContextTextTest(unittest.TestCase):
+    LINES = [
+        'acme confidential report',
+        'secret acme corp',
+        'the acmesecret internal data',
+        'private confidential secret',
+        'x confidential yy',
+    ]
+
+    def test_matches_get_textbox(self):
+        doc = fitz.open()
+        page = make_page(doc, self.LINES)
+        textpage = page.get_textpage()
+        for word in ('confidential', 'secret', 'private', 'internal'):
+            for area in page.search_for(word):
+                for pad in (0, 20):
+                    widened = fitz.Rect(area.x0 - pad, area.y0, area.x1 + pad, area.y1)
+                    self.assertEqual(rx._context_text(textpage, area, pad),
+                                     page.get_textbox(widened).casefold())
+
+
+class PrescreenTest(unittest.TestCase):
+    LINES = [
+        'Acme CONFIDENTIAL report',
+        'the quarterly confi-',
+        'dential figures  and   totals',
+        'Secret  Project x',
+    ]
+    PATTERNS = [
+        'confidential', 'Acme confidential', 'report the quarterly', 'quarterly confidential',
+        'figures and totals', 'secret project', 'SECRET', 'dential figures', 'project x',
+        'absent', ' ', '',
+    ]
+
+    def check(self, patterns):
+        doc = fitz.open()
+        page = make_page(doc, self.LINES)
+        keys, automaton, always_search = rx._build_prescreen(patterns)
+        kept = rx._prescreen(page, patterns, keys, automaton, always_search)
+        # Never drop a pattern search_for would find; text that isn't there is dropped
+        for pattern in patterns:
+            if page.search_for(pattern):
+                self.assertIn(pattern, kept)
+        self.assertNotIn('absent', kept)
+        return automaton
+
+    def test_substring_prescreen(self):
+        self.assertIsNone(self.check(self.PATTERNS))
+
+    @unittest.skipIf(rx.ahocorasick is None, 'pyahocorasick not installed')
+    def test_automaton_prescreen(self):
+        filler = [f'filler{i}' for i in range(rx.AHOCORASICK_MIN_PATTERNS)]
+        self.assertIsNotNone(self.check(self.PATTERNS + filler))
+
+
+class ProtectIndexTest(unittest.TestCase):
+    """Every ProtectIndex backend agrees with a plain containment test"""
+
+    def make_case(self, count, seed=0):
+        rng = random.Random(seed)
+        rects = []
+        for _ in range(count):
+            x, y = rng.uniform(0, 500), rng.uniform(0, 700)
+            rects.append([x, y, x + rng.uniform(5, 120), y + rng.uniform(5, 60)])
+        areas = []
+        for _ in range(300):
+            x, y = rng.uniform(0, 550), rng.uniform(0, 750)
+            areas.append(fitz.Rect(x, y, x + rng.uniform(1, 40), y + rng.uniform(1, 15)))
+        # Edges that touch count as contained
+        areas.extend(fitz.Rect(r) for r in rects[:5])
+        return rects, areas
+
+    @staticmethod
+    def expected(rects, area):
+        return any(x1 <= area.x0 and y1 <= area.y0 and x2 >= area.x1 and y2 >= area.y1
+                   for x1, y1, x2, y2 in rects)
+
+    def check(self, count, backend):
+        rects, areas = self.make_case(count)
+        index = rx.ProtectIndex(rects)
+        self.assertEqual(index._tree is not None, backend == 'rtree')
+        self.assertEqual(index._arr is not None, backend == 'numpy')
+        expected = [self.expected(rects, area) for area in areas]
+        self.assertTrue(any(expected))
+        self.assertEqual([index.contains(area) for area in areas], expected)
+        self.assertEqual(index.contains_many(areas), expected)
+        # Past NUMPY_MAX_PAIRS contains_many falls back to contains per area
+        with mock.patch.object(rx.ProtectIndex, 'NUMPY_MAX_PAIRS', 0):
+            self.assertEqual(index.contains_many(areas), expected)
+
+    def test_plain(self):
+        with mock.patch.object(rx, 'rtree_index', None), mock.patch.object(rx, 'np', None):
+            for count in (1, 8, rx.ProtectIndex.RTREE_MIN_RECTS):
+                self.check(count, 'plain')
+
+    @unittest.skipIf(rx.np is None, 'numpy not installed')
+    def test_numpy(self):
+        with mock.patch.object(rx, 'rtree_index', None):
+            self.check(rx.ProtectIndex.NUMPY_MIN_RECTS - 1, 'plain')
+            self.check(rx.ProtectIndex.NUMPY_MIN_RECTS, 'numpy')
+            self.check(rx.ProtectIndex.RTREE_MIN_RECTS * 2, 'numpy')
+
+    @unittest.skipIf(rx.rtree_index is None, 'rtree not installed')
+    def test_rtree(self):
+        self.check(rx.ProtectIndex.RTREE_MIN_RECTS, 'rtree')
+        self.check(rx.ProtectIndex.RTREE_MIN_RECTS * 4, 'rtree')
+
+    def test_empty(self):
+        index = rx.ProtectIndex([])
+        self.assertFalse(index.contains(fitz.Rect(0, 0, 1, 1)))
+        self.assertEqual(index.contains_many([fitz.Rect(0, 0, 1, 1)]), [False])
+
+
+class ParallelScanTest(unittest.TestCase):
+    SECRETS = ['confidential', 'acme corp', 'Project Falcon']
+
+    @classmethod
+    def setUpClass(cls):
+        # Spawned workers import the module by name, so load it from a copy
+        # saved under an importable one
+        cls.tmp = tempfile.TemporaryDirectory()
+        shutil.copy(SCRIPT, Path(cls.tmp.name) / 'redact_x_unified.py')
+        sys.path.insert(0, cls.tmp.name)
+        sys.modules.pop('redact_x_unified', None)
+        cls.mod = importlib.import_module('redact_x_unified')
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.modules.pop('redact_x_unified', None)
+        sys.path.remove(cls.tmp.name)
+        cls.tmp.cleanup()
+
+    def redact(self, src, name, min_pages):
+        out = str(Path(self.tmp.name) / name)
+        with mock.patch.object(self.mod, 'PARALLEL_SCAN_MIN_PAGES', min_pages), \
+                mock.patch.object(self.mod.os, 'cpu_count', return_value=2), \
+                mock.patch.object(self.mod, '_scan_page', wraps=self.mod._scan_page) as scan:
+            self.mod.apply_redactions(
+                src, out, {'1': [[10, 10, 40, 40]]}, {}, {}, {},
+                {'keywords': self.SECRETS, 'passages': []}, ['acme corp ltd'],
+                [r'\d{3}-\d{2}-\d{4}'])
+        return out, scan.call_count
+
+    def test_matches_in_process_scan(self):
+        doc = fitz.open()
+        for i in range(6):
+            make_page(doc, [f'page {i} confidential memo', 'acme corp and acme corp ltd',
+                            'Project Falcon SSN 123-45-6789', 'nothing to see here'])
+        src = str(Path(self.tmp.name) / 'in.pdf')
+        doc.save(src)
+
+        serial, serial_scans = self.redact(src, 'serial.pdf', 10 ** 9)
+        parallel, parallel_scans = self.redact(src, 'parallel.pdf', 1)
+        self.assertEqual(serial_scans, 6)
+        self.assertEqual(parallel_scans, 0)
+
+        with fitz.open(serial) as a, fitz.open(parallel) as b:
+            self.assertEqual(len(a), len(b))
+            for pa, pb in zip(a, b):
+                self.assertEqual(pa.get_text(), pb.get_text())
+                self.assertEqual([d['rect'] for d in pa.get_drawings()],
+                                 [d['rect'] for d in pb.get_drawings()])
+                self.assertNotIn('confidential', pa.get_text())
+                self.assertIn('acme corp ltd', pa.get_text())
+
+
+if __name__ == '__main__':
+    unittest.main()